@@ -1,146 +1,237 @@
-"""
-RTL 代码生成功能演示
-
-演示如何使用 VESA 时序计算器生成不同分辨率的 RTL 代码
-"""
-
-import os
-import sys
-
-# 添加 src 目录到 Python 路径
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from vesa_timing_calculator import VesaCalculator
-from vesa_timing_rtl_template import generate_verilog_rtl, generate_testbench
-
-
-def generate_timing_rtl(h_active, v_active, refresh_rate, reduced_blanking=False):
-    """
-    生成指定分辨率和刷新率的 RTL 代码
-    
-    参数:
-        h_active: 水平分辨率
-        v_active: 垂直分辨率
-        refresh_rate: 刷新率
-        reduced_blanking: 是否使用 CVT-RB 模式
-    """
-    calculator = VesaCalculator()
-    
-    print(f"\n{'='*70}")
-    print(f"生成 {h_active}x{v_active}@{refresh_rate}Hz 时序 RTL 代码")
-    if reduced_blanking:
-        print("模式: CVT Reduced Blanking")
-    else:
-        print("模式: 标准 CVT")
-    print('='*70)
-    
-    # 计算时序参数
-    results = calculator.calculate(
-        h_active=h_active,
-        v_active=v_active,
-        refresh_rate=refresh_rate,
-        reduced_blanking=reduced_blanking
-    )
-    
-    if 'error' in results:
-        print(f"错误: {results['message']}")
-        return False
-    
-    # 添加基本参数
-    results['h_active'] = h_active
-    results['v_active'] = v_active
-    results['refresh_rate'] = refresh_rate
-    
-    # 显示计算结果
-    print(f"\n时序参数:")
-    print(f"  像素时钟:     {results['pixel_clock']:8.2f} MHz")
-    print(f"  水平总像素:   {results['h_total']:8d} pixels")
-    print(f"  水平消隐区:   {results['h_blanking']:8d} pixels")
-    print(f"  垂直总行数:   {results['v_total']:8d} lines")
-    print(f"  垂直消隐区:   {results['v_blanking']:8d} lines")
-    
-    # 创建输出目录
-    output_dir = "./output"
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    
-    # 生成文件名
-    rb_suffix = "_rb" if reduced_blanking else ""
-    module_name = f"vesa_timing_{h_active}x{v_active}_{int(refresh_rate)}hz{rb_suffix}"
-    
-    # 生成 RTL 代码
-    rtl_code = generate_verilog_rtl(results, module_name)
-    rtl_filename = os.path.join(output_dir, f"{module_name}.v")
-    
-    with open(rtl_filename, 'w', encoding='utf-8') as f:
-        f.write(rtl_code)
-    
-    # 生成测试平台
-    tb_code = generate_testbench(results, module_name)
-    tb_filename = os.path.join(output_dir, f"tb_{module_name}.v")
-    
-    with open(tb_filename, 'w', encoding='utf-8') as f:
-        f.write(tb_code)
-    
-    print(f"\n生成的文件:")
-    print(f"  ✓ {rtl_filename}")
-    print(f"  ✓ {tb_filename}")
-    
-    return True
-
-
-def main():
-    """主函数：生成多个常见分辨率的 RTL 代码"""
-    
-    print("="*70)
-    print("VESA 时序 RTL 代码生成演示")
-    print("="*70)
-    
-    # 定义要生成的时序配置
-    configs = [
-        # (h_active, v_active, refresh_rate, reduced_blanking, description)
-        (1280, 720, 60.0, False, "HD 720p60"),
-        (1920, 1080, 60.0, False, "Full HD 1080p60"),
-        (1920, 1080, 60.0, True, "Full HD 1080p60 RB"),
-        (2560, 1440, 60.0, False, "QHD 1440p60"),
-        (3840, 2160, 30.0, False, "4K UHD 2160p30"),
-        (3840, 2160, 60.0, True, "4K UHD 2160p60 RB"),
-    ]
-    
-    success_count = 0
-    total_count = len(configs)
-    
-    for h_active, v_active, refresh_rate, reduced_blanking, description in configs:
-        print(f"\n处理: {description}")
-        if generate_timing_rtl(h_active, v_active, refresh_rate, reduced_blanking):
-            success_count += 1
-    
-    # 总结
-    print("\n" + "="*70)
-    print("生成完成！")
-    print("="*70)
-    print(f"成功生成: {success_count}/{total_count} 个配置")
-    print(f"输出目录: ./output")
-    
-    # 列出所有生成的文件
-    output_dir = "./output"
-    if os.path.exists(output_dir):
-        files = [f for f in os.listdir(output_dir) if f.endswith('.v')]
-        print(f"\n生成的文件列表 ({len(files)} 个文件):")
-        for i, filename in enumerate(sorted(files), 1):
-            filepath = os.path.join(output_dir, filename)
-            size = os.path.getsize(filepath)
-            print(f"  {i:2d}. {filename:50s} ({size:6d} bytes)")
-    
-    print("\n" + "="*70)
-    print("使用说明:")
-    print("  1. 查看生成的 RTL 代码: cat output/<文件名>.v")
-    print("  2. 使用 Icarus Verilog 仿真:")
-    print("     iverilog -o sim output/<模块名>.v output/tb_<模块名>.v")
-    print("     vvp sim")
-    print("  3. 查看波形: gtkwave tb_<模块名>.vcd")
-    print("="*70)
-
-
-if __name__ == "__main__":
-    main()
+"""
+RTL 代码生成功能演示
+
+演示如何使用 VESA 时序计算器生成不同分辨率的 RTL 代码
+"""
+
+import functools
+import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# 添加 src 目录到 Python 路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from vesa_timing_core import VesaCalculator
+from vesa_timing_rtl_template import (_default_timestamp, generate_config_wrapper,
+                                      generate_core_module, generate_testbench)
+
+# 模块级共享计算器实例（无状态，所有配置复用同一个）
+_CALC = VesaCalculator()
+
+
+@functools.lru_cache(maxsize=256)
+def _render_rtl(h_active, v_active, refresh_rate, reduced_blanking, timestamp=None):
+    """
+    计算时序参数并渲染 RTL/测试平台代码（按输入参数缓存）
+
+    整个计算+渲染流水线是输入参数的纯函数，因此用 lru_cache
+    按 (h_active, v_active, refresh_rate, reduced_blanking) 缓存，
+    重复配置直接命中缓存。
+
+    返回:
+        (rtl_code, tb_code, summary): 成功时为渲染结果和参数摘要文本；
+        失败时 rtl_code/tb_code 为 None，summary 为错误消息
+    """
+    # 计算时序参数
+    results = _CALC.calculate(
+        h_active=h_active,
+        v_active=v_active,
+        refresh_rate=refresh_rate,
+        reduced_blanking=reduced_blanking
+    )
+
+    if 'error' in results:
+        return None, None, results['message']
+
+    # 添加基本参数
+    results['h_active'] = h_active
+    results['v_active'] = v_active
+    results['refresh_rate'] = refresh_rate
+
+    # 格式化参数摘要
+    summary = (
+        f"  像素时钟:     {results['pixel_clock']:8.2f} MHz\n"
+        f"  水平总像素:   {results['h_total']:8d} pixels\n"
+        f"  水平消隐区:   {results['h_blanking']:8d} pixels\n"
+        f"  垂直总行数:   {results['v_total']:8d} lines\n"
+        f"  垂直消隐区:   {results['v_blanking']:8d} lines"
+    )
+
+    # 生成模块名
+    rb_suffix = "_rb" if reduced_blanking else ""
+    module_name = f"vesa_timing_{h_active}x{v_active}_{int(refresh_rate)}hz{rb_suffix}"
+
+    # 渲染配置包装模块和测试平台；核心模块由 main() 统一生成一次
+    rtl_code = generate_config_wrapper(results, module_name, timestamp=timestamp)
+    tb_code = generate_testbench(results, module_name, timestamp=timestamp)
+
+    return rtl_code, tb_code, summary
+
+
+def _write_if_changed(path, data):
+    """
+    仅在内容变化时写入文件
+
+    对新旧内容做 blake2b 摘要比较，内容一致则跳过写入，
+    保持文件 mtime 不变，下游工具（make/iverilog）的缓存不会失效。
+
+    参数:
+        path: 目标文件路径
+        data: 要写入的文本内容
+
+    返回:
+        是否实际执行了写入
+    """
+    path = Path(path)
+    new_bytes = data.encode('utf-8')
+
+    if path.exists():
+        old_digest = hashlib.blake2b(path.read_bytes(), digest_size=16).digest()
+        new_digest = hashlib.blake2b(new_bytes, digest_size=16).digest()
+        if old_digest == new_digest:
+            return False
+
+    path.write_bytes(new_bytes)
+    return True
+
+
+def generate_timing_rtl(h_active, v_active, refresh_rate, reduced_blanking=False,
+                        timestamp=None):
+    """
+    生成指定分辨率和刷新率的 RTL 代码
+
+    参数:
+        h_active: 水平分辨率
+        v_active: 垂直分辨率
+        refresh_rate: 刷新率
+        reduced_blanking: 是否使用 CVT-RB 模式
+        timestamp: 写入文件头的时间戳；None 时由模板模块自动生成
+    """
+    mode = "CVT Reduced Blanking" if reduced_blanking else "标准 CVT"
+    header = (
+        f"\n{'='*70}\n"
+        f"生成 {h_active}x{v_active}@{refresh_rate}Hz 时序 RTL 代码\n"
+        f"模式: {mode}\n"
+        f"{'='*70}"
+    )
+
+    # 计算 + 渲染（纯函数部分，带缓存）
+    rtl_code, tb_code, summary = _render_rtl(
+        h_active, v_active, refresh_rate, reduced_blanking, timestamp)
+
+    if rtl_code is None:
+        print(f"{header}\n错误: {summary}")
+        return False
+
+    # 输出目录（由 main() 统一创建）
+    output_dir = "./output"
+
+    # 生成文件名
+    rb_suffix = "_rb" if reduced_blanking else ""
+    module_name = f"vesa_timing_{h_active}x{v_active}_{int(refresh_rate)}hz{rb_suffix}"
+
+    # 内容未变化时跳过写入（内容哈希门控）
+    rtl_filename = os.path.join(output_dir, f"{module_name}.v")
+    _write_if_changed(rtl_filename, rtl_code)
+
+    tb_filename = os.path.join(output_dir, f"tb_{module_name}.v")
+    _write_if_changed(tb_filename, tb_code)
+
+    # 所有输出合并成一条消息、一次写出，减少 stdout 系统调用
+    print(f"{header}\n"
+          f"\n时序参数:\n{summary}\n"
+          f"\n生成的文件:\n"
+          f"  ✓ {rtl_filename}\n"
+          f"  ✓ {tb_filename}")
+
+    return True
+
+
+def _do_one(cfg, timestamp=None):
+    """
+    处理单个时序配置（供进程池调用的顶层可序列化函数）
+
+    参数:
+        cfg: (h_active, v_active, refresh_rate, reduced_blanking, description)
+
+    返回:
+        生成是否成功
+    """
+    h_active, v_active, refresh_rate, reduced_blanking, description = cfg
+    print(f"\n处理: {description}")
+    return generate_timing_rtl(h_active, v_active, refresh_rate, reduced_blanking,
+                               timestamp=timestamp)
+
+
+def main():
+    """主函数：生成多个常见分辨率的 RTL 代码"""
+    
+    print("="*70)
+    print("VESA 时序 RTL 代码生成演示")
+    print("="*70)
+    
+    # 定义要生成的时序配置
+    configs = [
+        # (h_active, v_active, refresh_rate, reduced_blanking, description)
+        (1280, 720, 60.0, False, "HD 720p60"),
+        (1920, 1080, 60.0, False, "Full HD 1080p60"),
+        (1920, 1080, 60.0, True, "Full HD 1080p60 RB"),
+        (2560, 1440, 60.0, False, "QHD 1440p60"),
+        (3840, 2160, 30.0, False, "4K UHD 2160p30"),
+        (3840, 2160, 60.0, True, "4K UHD 2160p60 RB"),
+    ]
+    
+    # 创建输出目录（循环内不再重复检查）
+    os.makedirs("./output", exist_ok=True)
+
+    # 整批共用一个时间戳，所有文件头一致且渲染只取一次时间
+    # （走模板模块的默认时间戳，SOURCE_DATE_EPOCH 下输出可复现）
+    timestamp = _default_timestamp()
+
+    # 参数化核心模块整批只生成一份，各配置文件只是薄包装
+    _write_if_changed("./output/vesa_timing_gen.v",
+                      generate_core_module(timestamp=timestamp))
+
+    total_count = len(configs)
+
+    # 各配置相互独立（纯计算 + 文件写入），用进程池并行处理
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(
+            functools.partial(_do_one, timestamp=timestamp), configs))
+
+    success_count = sum(results)
+    
+    # 总结
+    print("\n" + "="*70)
+    print("生成完成！")
+    print("="*70)
+    print(f"成功生成: {success_count}/{total_count} 个配置")
+    print(f"输出目录: ./output")
+    print(f"渲染缓存: {_render_rtl.cache_info()}")
+    
+    # 列出所有生成的文件（scandir 一次目录读取即带回 stat 信息）
+    output_dir = "./output"
+    if os.path.exists(output_dir):
+        with os.scandir(output_dir) as it:
+            entries = sorted(
+                (e for e in it if e.name.endswith('.v')),
+                key=lambda e: e.name)
+        print(f"\n生成的文件列表 ({len(entries)} 个文件):")
+        for i, entry in enumerate(entries, 1):
+            print(f"  {i:2d}. {entry.name:50s} ({entry.stat().st_size:6d} bytes)")
+    
+    print("\n" + "="*70)
+    print("使用说明:")
+    print("  1. 查看生成的 RTL 代码: cat output/<文件名>.v")
+    print("  2. 使用 Icarus Verilog 仿真:")
+    print("     iverilog -o sim output/vesa_timing_gen.v output/<模块名>.v output/tb_<模块名>.v")
+    print("     vvp sim")
+    print("  3. 查看波形: gtkwave tb_<模块名>.vcd")
+    print("="*70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+//==============================================================================
+// VESA Timing Generator (参数化核心模块)
+//
+// 自动生成时间: 2026-09-01 03:46:26
+// 生成工具: VESA 视频时序计算器
+//
+// 所有时序参数均为模块 parameter，由各配置包装模块在例化时覆盖。
+//==============================================================================
+
+module vesa_timing_gen #(
+    parameter H_ACTIVE      = 1920,
+    parameter H_FRONT_PORCH = 88,
+    parameter H_SYNC_PULSE  = 44,
+    parameter H_BACK_PORCH  = 148,
+    parameter H_TOTAL       = 2200,
+
+    parameter V_ACTIVE      = 1080,
+    parameter V_FRONT_PORCH = 4,
+    parameter V_SYNC_PULSE  = 5,
+    parameter V_BACK_PORCH  = 36,
+    parameter V_TOTAL       = 1125,
+
+    parameter H_CW          = 12,   // 水平计数器位宽
+    parameter V_CW          = 11    // 垂直计数器位宽
+) (
+    input  wire             clk,           // 像素时钟
+    input  wire             rst_n,         // 异步复位，低电平有效
+
+    output reg              hsync,         // 水平同步信号
+    output reg              vsync,         // 垂直同步信号
+    output reg              de,            // 数据使能信号
+    output reg              frame_valid,   // 帧有效信号
+
+    output reg  [H_CW-1:0]  h_count,       // 水平计数器
+    output reg  [V_CW-1:0]  v_count        // 垂直计数器
+);
+
+//==============================================================================
+// 同步信号边界
+//==============================================================================
+
+localparam H_SYNC_START  = H_ACTIVE + H_FRONT_PORCH;
+localparam H_SYNC_END    = H_SYNC_START + H_SYNC_PULSE;
+
+localparam V_SYNC_START  = V_ACTIVE + V_FRONT_PORCH;
+localparam V_SYNC_END    = V_SYNC_START + V_SYNC_PULSE;
+
+//==============================================================================
+// 水平计数器
+//==============================================================================
+
+always @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+        h_count <= {H_CW{1'b0}};
+    end else begin
+        if (h_count == H_TOTAL - 1) begin
+            h_count <= {H_CW{1'b0}};
+        end else begin
+            h_count <= h_count + 1'b1;
+        end
+    end
+end
+
+//==============================================================================
+// 垂直计数器
+//==============================================================================
+
+always @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+        v_count <= {V_CW{1'b0}};
+    end else begin
+        if (h_count == H_TOTAL - 1) begin
+            if (v_count == V_TOTAL - 1) begin
+                v_count <= {V_CW{1'b0}};
+            end else begin
+                v_count <= v_count + 1'b1;
+            end
+        end
+    end
+end
+
+//==============================================================================
+// 同步与输出信号生成
+//==============================================================================
+
+always @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+        hsync       <= 1'b1;
+        vsync       <= 1'b1;
+        de          <= 1'b0;
+        frame_valid <= 1'b0;
+    end else begin
+        // 同步脉冲为低电平（与 de/frame_valid 同样保持
+        // 一拍寄存延迟，引脚波形与范围比较写法逐拍一致）
+        if (h_count == H_SYNC_START)
+            hsync <= 1'b0;
+        else if (h_count == H_SYNC_END)
+            hsync <= 1'b1;
+
+        // 垂直同步在行首翻转（v_count 已在行尾更新完毕）
+        if (h_count == 0) begin
+            if (v_count == V_SYNC_START)
+                vsync <= 1'b0;
+            else if (v_count == V_SYNC_END)
+                vsync <= 1'b1;
+        end
+
+        // 在有效显示区域内
+        de          <= (h_count < H_ACTIVE) && (v_count < V_ACTIVE);
+        // 在有效帧内
+        frame_valid <= (v_count < V_ACTIVE);
+    end
+end
+
+endmodule
\ No newline at end of file
@@ -1,1300 +1,687 @@
-"""
-VESA 视频时序计算器
-
-基于 VESA CVT (Coordinated Video Timing) 标准计算视频时序参数的桌面应用程序。
-"""
-
-from dataclasses import dataclass
-from typing import Tuple
-
-
-@dataclass
-class TimingParameters:
-    """时序参数数据模型"""
-    
-    # 输入参数
-    h_active: int
-    v_active: int
-    refresh_rate: float
-    reduced_blanking: bool
-    
-    # 输出参数
-    pixel_clock: float = 0.0
-    h_total: int = 0
-    h_blanking: int = 0
-    h_front_porch: int = 0
-    h_sync_pulse: int = 0
-    h_back_porch: int = 0
-    v_total: int = 0
-    v_blanking: int = 0
-    v_front_porch: int = 0
-    v_sync_pulse: int = 0
-    v_back_porch: int = 0
-    
-    def validate_input(self) -> Tuple[bool, str]:
-        """
-        验证输入参数有效性
-        
-        返回:
-            (is_valid, error_message): 验证结果和错误消息（如果有）
-        """
-        # 验证水平分辨率范围 (640-7680)
-        if self.h_active < 640 or self.h_active > 7680:
-            return False, f"水平分辨率必须在 640 到 7680 像素之间，当前值: {self.h_active}"
-        
-        # 验证垂直分辨率范围 (480-4320)
-        if self.v_active < 480 or self.v_active > 4320:
-            return False, f"垂直分辨率必须在 480 到 4320 行之间，当前值: {self.v_active}"
-        
-        # 验证刷新率范围 (24-240 Hz)
-        if self.refresh_rate < 24.0 or self.refresh_rate > 240.0:
-            return False, f"刷新率必须在 24 到 240 Hz 之间，当前值: {self.refresh_rate}"
-        
-        # 验证参数不为零或负值
-        if self.h_active <= 0:
-            return False, f"水平分辨率必须大于零，当前值: {self.h_active}"
-        
-        if self.v_active <= 0:
-            return False, f"垂直分辨率必须大于零，当前值: {self.v_active}"
-        
-        if self.refresh_rate <= 0.0:
-            return False, f"刷新率必须大于零，当前值: {self.refresh_rate}"
-        
-        return True, ""
-    
-    def to_dict(self) -> dict:
-        """
-        转换为字典格式
-        
-        返回:
-            包含所有参数的字典
-        """
-        return {
-            # 输入参数
-            'h_active': self.h_active,
-            'v_active': self.v_active,
-            'refresh_rate': self.refresh_rate,
-            'reduced_blanking': self.reduced_blanking,
-            
-            # 输出参数
-            'pixel_clock': self.pixel_clock,
-            'h_total': self.h_total,
-            'h_blanking': self.h_blanking,
-            'h_front_porch': self.h_front_porch,
-            'h_sync_pulse': self.h_sync_pulse,
-            'h_back_porch': self.h_back_porch,
-            'v_total': self.v_total,
-            'v_blanking': self.v_blanking,
-            'v_front_porch': self.v_front_porch,
-            'v_sync_pulse': self.v_sync_pulse,
-            'v_back_porch': self.v_back_porch,
-        }
-
-
-class VesaCalculator:
-    """
-    VESA CVT 标准时序计算器
-    
-    实现 VESA Coordinated Video Timing (CVT) 标准算法，
-    支持标准 CVT 模式和 CVT Reduced Blanking (CVT-RB) 模式。
-    """
-    
-    # 标准 CVT 模式常量
-    H_SYNC_PERCENT = 8.0  # 水平同步脉冲占消隐区的百分比
-    MIN_V_SYNC_BP = 550.0  # 最小垂直同步+后廊时间 (微秒)
-    MIN_V_PORCH = 3  # 最小垂直前廊行数
-    CELL_GRAN = 8  # 像素粒度（水平像素必须是 8 的倍数）
-    
-    # CVT-RB 模式常量
-    RB_H_BLANK = 160  # 固定水平消隐像素
-    RB_V_BLANK = 460.0  # 固定垂直消隐时间 (微秒)
-    RB_H_SYNC = 32  # 固定水平同步脉冲宽度
-    RB_V_SYNC = 8  # 固定垂直同步脉冲行数
-    RB_MIN_V_BPORCH = 6  # 最小垂直后廊行数
-    
-    def calculate(self, h_active: int, v_active: int,
-                  refresh_rate: float = None, pixel_clock: float = None,
-                  reduced_blanking: bool = False) -> dict:
-        """
-        计算 CVT 时序参数
-        
-        支持三种计算模式：
-        1. 正向计算：提供 refresh_rate，计算 pixel_clock 和其他参数
-        2. 反向计算：提供 pixel_clock，计算 refresh_rate 和其他参数
-        3. 双参数计算：同时提供 refresh_rate 和 pixel_clock，计算时序参数
-        
-        参数:
-            h_active: 水平有效像素 (640-7680)
-            v_active: 垂直有效行数 (480-4320)
-            refresh_rate: 刷新率 Hz (24-240)，模式1和3时必需
-            pixel_clock: 像素时钟 MHz，模式2和3时必需
-            reduced_blanking: 是否使用 CVT-RB 模式
-            
-        返回:
-            包含所有时序参数的字典，如果输入无效则返回错误信息
-        """
-        # 验证基本参数
-        if h_active < 640 or h_active > 7680:
-            return {
-                'error': True,
-                'message': f"水平分辨率必须在 640 到 7680 像素之间，当前值: {h_active}"
-            }
-        
-        if v_active < 480 or v_active > 4320:
-            return {
-                'error': True,
-                'message': f"垂直分辨率必须在 480 到 4320 行之间，当前值: {v_active}"
-            }
-        
-        # 检查计算模式
-        if refresh_rate is None and pixel_clock is None:
-            return {
-                'error': True,
-                'message': '请提供刷新率或像素时钟参数'
-            }
-        
-        # 根据模式选择计算方法
-        try:
-            if refresh_rate is not None and pixel_clock is not None:
-                # 新增模式3：同时提供刷新率和像素时钟
-                if refresh_rate < 24.0 or refresh_rate > 240.0:
-                    return {
-                        'error': True,
-                        'message': f"刷新率必须在 24 到 240 Hz 之间，当前值: {refresh_rate}"
-                    }
-                
-                if pixel_clock <= 0:
-                    return {
-                        'error': True,
-                        'message': f"像素时钟必须大于零，当前值: {pixel_clock}"
-                    }
-                
-                return self._calculate_with_both_params(h_active, v_active, refresh_rate, pixel_clock, reduced_blanking)
-            elif refresh_rate is not None:
-                # 模式1：正向计算：从刷新率计算像素时钟
-                if refresh_rate < 24.0 or refresh_rate > 240.0:
-                    return {
-                        'error': True,
-                        'message': f"刷新率必须在 24 到 240 Hz 之间，当前值: {refresh_rate}"
-                    }
-                
-                if reduced_blanking:
-                    return self._calculate_reduced_blanking(h_active, v_active, refresh_rate)
-                else:
-                    return self._calculate_standard_cvt(h_active, v_active, refresh_rate)
-            else:
-                # 模式2：反向计算：从像素时钟计算刷新率
-                if pixel_clock <= 0:
-                    return {
-                        'error': True,
-                        'message': f"像素时钟必须大于零，当前值: {pixel_clock}"
-                    }
-                
-                return self._calculate_from_pixel_clock(h_active, v_active, pixel_clock, reduced_blanking)
-                
-        except Exception as e:
-            return {
-                'error': True,
-                'message': f'计算过程中发生错误: {str(e)}'
-            }
-    
-    def _calculate_standard_cvt(self, h_active: int, v_active: int, 
-                                refresh_rate: float) -> dict:
-        """
-        实现标准 CVT 算法
-        
-        基于 VESA CVT 1.2 标准规范计算时序参数。
-        
-        算法步骤:
-        1. 将水平分辨率调整为 CELL_GRAN 的倍数
-        2. 计算垂直时序参数（前廊、同步、后廊）
-        3. 计算理想消隐时间和水平周期
-        4. 计算水平时序参数
-        5. 计算像素时钟频率
-        
-        参数:
-            h_active: 水平有效像素
-            v_active: 垂直有效行数
-            refresh_rate: 刷新率 Hz
-            
-        返回:
-            包含所有 11 个时序参数的字典
-        """
-        import math
-        
-        # 步骤 1: 确保水平分辨率是 CELL_GRAN 的倍数
-        # VESA CVT 标准要求水平像素必须是 8 的倍数
-        h_active_rounded = (h_active // self.CELL_GRAN) * self.CELL_GRAN
-        
-        # 步骤 2: 计算垂直时序参数
-        # 垂直前廊固定为最小值
-        v_front_porch = self.MIN_V_PORCH
-        
-        # 垂直同步脉冲固定为 4 行（CVT 标准）
-        v_sync_pulse = 4
-        
-        # 计算垂直后廊
-        # 根据 CVT 标准，垂直同步+后廊的最小时间为 MIN_V_SYNC_BP 微秒
-        # 首先估算行时间（假设典型的水平频率）
-        # 使用迭代方法：先估算，然后根据实际计算调整
-        
-        # 估算垂直场频率（考虑消隐）
-        v_sync_bp_lines = 10  # 初始估算值
-        estimated_v_total = v_active + v_front_porch + v_sync_pulse + v_sync_bp_lines
-        
-        # 估算水平频率 (kHz)
-        h_freq_est = refresh_rate * estimated_v_total / 1000.0
-        
-        # 计算行时间 (微秒)
-        h_period_est = 1000.0 / h_freq_est
-        
-        # 根据最小垂直同步+后廊时间计算所需行数
-        min_v_sync_bp_lines = math.ceil(self.MIN_V_SYNC_BP / h_period_est)
-        
-        # 垂直后廊 = 最小同步+后廊行数 - 同步脉冲行数
-        v_back_porch = max(min_v_sync_bp_lines - v_sync_pulse, 1)
-        
-        # 计算垂直消隐和总行数
-        v_blanking = v_front_porch + v_sync_pulse + v_back_porch
-        v_total = v_active + v_blanking
-        
-        # 步骤 3: 计算理想消隐时间和水平周期
-        # 计算实际垂直场频率
-        v_field_rate_est = refresh_rate
-        
-        # 计算水平频率 (Hz)
-        h_freq = v_field_rate_est * v_total
-        
-        # 计算理想水平周期 (微秒)
-        ideal_h_period = 1000000.0 / h_freq
-        
-        # 步骤 4: 计算水平时序参数
-        # 根据 CVT 标准，水平消隐时间约占总时间的固定比例
-        # 使用标准公式计算消隐像素数
-        
-        # 计算理想消隐像素数（基于 CVT 标准公式）
-        # CVT 使用固定的消隐比例
-        h_blank_pixels = 160  # CVT 标准的典型值，会根据分辨率调整
-        
-        # 更精确的计算：基于 CVT 1.2 标准
-        # 消隐时间 = (水平周期 * 消隐百分比) / 像素时钟周期
-        # 简化计算：使用标准比例
-        if h_active_rounded <= 1024:
-            h_blank_pixels = 256
-        elif h_active_rounded <= 1280:
-            h_blank_pixels = 320
-        elif h_active_rounded <= 1920:
-            h_blank_pixels = 280
-        else:
-            h_blank_pixels = 288
-        
-        # 确保消隐像素是 CELL_GRAN 的倍数
-        h_blanking = ((h_blank_pixels + self.CELL_GRAN - 1) // self.CELL_GRAN) * self.CELL_GRAN
-        
-        # 计算水平总像素
-        h_total = h_active_rounded + h_blanking
-        
-        # 计算水平同步脉冲宽度（占消隐区的 8%）
-        h_sync_pulse = int(round(h_blanking * self.H_SYNC_PERCENT / 100.0))
-        # 确保是 CELL_GRAN 的倍数
-        h_sync_pulse = ((h_sync_pulse + self.CELL_GRAN - 1) // self.CELL_GRAN) * self.CELL_GRAN
-        
-        # 水平后廊（CVT 标准：消隐区的一半减去同步脉冲的一半）
-        h_back_porch = (h_blanking // 2) - (h_sync_pulse // 2)
-        # 确保是 CELL_GRAN 的倍数
-        h_back_porch = (h_back_porch // self.CELL_GRAN) * self.CELL_GRAN
-        
-        # 水平前廊（剩余的消隐像素）
-        h_front_porch = h_blanking - h_sync_pulse - h_back_porch
-        
-        # 步骤 5: 计算像素时钟频率
-        # 像素时钟 (MHz) = 水平总像素 * 垂直总行数 * 刷新率 / 1,000,000
-        pixel_clock = (h_total * v_total * refresh_rate) / 1000000.0
-        
-        # 返回所有计算结果
-        return {
-            'pixel_clock': round(pixel_clock, 2),
-            'h_total': h_total,
-            'h_blanking': h_blanking,
-            'h_front_porch': h_front_porch,
-            'h_sync_pulse': h_sync_pulse,
-            'h_back_porch': h_back_porch,
-            'v_total': v_total,
-            'v_blanking': v_blanking,
-            'v_front_porch': v_front_porch,
-            'v_sync_pulse': v_sync_pulse,
-            'v_back_porch': v_back_porch,
-        }
-    
-    def _calculate_reduced_blanking(self, h_active: int, v_active: int, 
-                                    refresh_rate: float) -> dict:
-        """
-        实现 CVT Reduced Blanking (CVT-RB) 算法
-        
-        CVT-RB 模式使用固定的消隐时间来减少带宽需求，
-        适用于数字显示接口（如 DVI、HDMI、DisplayPort）。
-        
-        算法特点:
-        - 固定的水平消隐像素 (160 pixels)
-        - 固定的垂直消隐时间 (460 微秒)
-        - 固定的同步脉冲宽度
-        - 更低的像素时钟频率
-        
-        参数:
-            h_active: 水平有效像素
-            v_active: 垂直有效行数
-            refresh_rate: 刷新率 Hz
-            
-        返回:
-            包含所有 11 个时序参数的字典
-        """
-        import math
-        
-        # 步骤 1: 确保水平分辨率是 CELL_GRAN 的倍数
-        h_active_rounded = (h_active // self.CELL_GRAN) * self.CELL_GRAN
-        
-        # 步骤 2: 使用固定的水平消隐参数（CVT-RB 标准）
-        h_blanking = self.RB_H_BLANK  # 固定 160 像素
-        h_sync_pulse = self.RB_H_SYNC  # 固定 32 像素
-        
-        # CVT-RB 的水平前廊和后廊分配
-        # 后廊 = 80 像素，前廊 = 48 像素（标准分配）
-        h_back_porch = 80
-        h_front_porch = h_blanking - h_sync_pulse - h_back_porch
-        
-        # 计算水平总像素
-        h_total = h_active_rounded + h_blanking
-        
-        # 步骤 3: 计算垂直时序参数
-        # 垂直同步脉冲固定为 8 行（CVT-RB 标准）
-        v_sync_pulse = self.RB_V_SYNC
-        
-        # 垂直前廊固定为最小值
-        v_front_porch = self.MIN_V_PORCH
-        
-        # 计算垂直后廊
-        # 首先估算水平频率和行时间
-        # 使用迭代方法计算
-        
-        # 初始估算：假设垂直后廊为最小值
-        v_back_porch = self.RB_MIN_V_BPORCH
-        v_blanking = v_front_porch + v_sync_pulse + v_back_porch
-        v_total_est = v_active + v_blanking
-        
-        # 计算水平频率 (Hz)
-        h_freq = refresh_rate * v_total_est
-        
-        # 计算行时间 (微秒)
-        h_period = 1000000.0 / h_freq
-        
-        # 根据固定的垂直消隐时间 (460 微秒) 计算所需行数
-        v_blanking_lines = math.ceil(self.RB_V_BLANK / h_period)
-        
-        # 确保垂直消隐行数至少包含前廊和同步脉冲
-        min_v_blanking = v_front_porch + v_sync_pulse + self.RB_MIN_V_BPORCH
-        v_blanking = max(v_blanking_lines, min_v_blanking)
-        
-        # 计算垂直后廊（剩余的消隐行数）
-        v_back_porch = v_blanking - v_front_porch - v_sync_pulse
-        
-        # 计算垂直总行数
-        v_total = v_active + v_blanking
-        
-        # 步骤 4: 计算像素时钟频率
-        # 像素时钟 (MHz) = 水平总像素 * 垂直总行数 * 刷新率 / 1,000,000
-        pixel_clock = (h_total * v_total * refresh_rate) / 1000000.0
-        
-        # 返回所有计算结果
-        return {
-            'pixel_clock': round(pixel_clock, 2),
-            'h_total': h_total,
-            'h_blanking': h_blanking,
-            'h_front_porch': h_front_porch,
-            'h_sync_pulse': h_sync_pulse,
-            'h_back_porch': h_back_porch,
-            'v_total': v_total,
-            'v_blanking': v_blanking,
-            'v_front_porch': v_front_porch,
-            'v_sync_pulse': v_sync_pulse,
-            'v_back_porch': v_back_porch,
-        }
-    
-    def _calculate_from_pixel_clock(self, h_active: int, v_active: int,
-                                    pixel_clock: float, reduced_blanking: bool = False) -> dict:
-        """
-        从像素时钟反向计算时序参数
-        
-        根据给定的像素时钟频率，计算对应的刷新率和其他时序参数。
-        使用 CVT 标准的固定消隐参数。
-        
-        参数:
-            h_active: 水平有效像素
-            v_active: 垂直有效行数
-            pixel_clock: 像素时钟频率 (MHz)
-            reduced_blanking: 是否使用 CVT-RB 模式
-            
-        返回:
-            包含所有 11 个时序参数和计算出的刷新率的字典
-        """
-        import math
-        
-        # 步骤 1: 确保水平分辨率是 CELL_GRAN 的倍数
-        h_active_rounded = (h_active // self.CELL_GRAN) * self.CELL_GRAN
-        
-        if reduced_blanking:
-            # CVT-RB 模式：使用固定的消隐参数
-            h_blanking = self.RB_H_BLANK
-            h_sync_pulse = self.RB_H_SYNC
-            h_back_porch = 80
-            h_front_porch = h_blanking - h_sync_pulse - h_back_porch
-            h_total = h_active_rounded + h_blanking
-            
-            # 垂直时序参数
-            v_sync_pulse = self.RB_V_SYNC
-            v_front_porch = self.MIN_V_PORCH
-            
-            # 估算垂直消隐
-            # 使用标准的 CVT-RB 垂直消隐时间
-            v_back_porch = self.RB_MIN_V_BPORCH
-            v_blanking = v_front_porch + v_sync_pulse + v_back_porch
-            
-            # 迭代计算以满足 460 微秒的垂直消隐时间
-            for _ in range(5):  # 最多迭代 5 次
-                v_total = v_active + v_blanking
-                
-                # 从像素时钟计算刷新率
-                # pixel_clock (MHz) = h_total * v_total * refresh_rate / 1,000,000
-                # refresh_rate = pixel_clock * 1,000,000 / (h_total * v_total)
-                refresh_rate = (pixel_clock * 1000000.0) / (h_total * v_total)
-                
-                # 计算行频率和行时间
-                h_freq = refresh_rate * v_total
-                h_period = 1000000.0 / h_freq  # 微秒
-                
-                # 根据 460 微秒的垂直消隐时间重新计算
-                v_blanking_lines = math.ceil(self.RB_V_BLANK / h_period)
-                min_v_blanking = v_front_porch + v_sync_pulse + self.RB_MIN_V_BPORCH
-                v_blanking_new = max(v_blanking_lines, min_v_blanking)
-                
-                # 检查是否收敛
-                if v_blanking_new == v_blanking:
-                    break
-                v_blanking = v_blanking_new
-                v_back_porch = v_blanking - v_front_porch - v_sync_pulse
-            
-        else:
-            # 标准 CVT 模式：使用标准的消隐参数
-            # 根据分辨率选择合适的水平消隐
-            if h_active_rounded <= 1024:
-                h_blank_pixels = 256
-            elif h_active_rounded <= 1280:
-                h_blank_pixels = 320
-            elif h_active_rounded <= 1920:
-                h_blank_pixels = 280
-            else:
-                h_blank_pixels = 288
-            
-            h_blanking = ((h_blank_pixels + self.CELL_GRAN - 1) // self.CELL_GRAN) * self.CELL_GRAN
-            h_total = h_active_rounded + h_blanking
-            
-            # 水平同步脉冲
-            h_sync_pulse = int(round(h_blanking * self.H_SYNC_PERCENT / 100.0))
-            h_sync_pulse = ((h_sync_pulse + self.CELL_GRAN - 1) // self.CELL_GRAN) * self.CELL_GRAN
-            
-            # 水平后廊和前廊
-            h_back_porch = (h_blanking // 2) - (h_sync_pulse // 2)
-            h_back_porch = (h_back_porch // self.CELL_GRAN) * self.CELL_GRAN
-            h_front_porch = h_blanking - h_sync_pulse - h_back_porch
-            
-            # 垂直时序参数
-            v_front_porch = self.MIN_V_PORCH
-            v_sync_pulse = 4
-            
-            # 估算垂直后廊
-            v_back_porch = 10  # 初始估算
-            
-            # 迭代计算以满足 550 微秒的最小垂直同步+后廊时间
-            for _ in range(5):  # 最多迭代 5 次
-                v_blanking = v_front_porch + v_sync_pulse + v_back_porch
-                v_total = v_active + v_blanking
-                
-                # 从像素时钟计算刷新率
-                refresh_rate = (pixel_clock * 1000000.0) / (h_total * v_total)
-                
-                # 计算行频率和行时间
-                h_freq = refresh_rate * v_total
-                h_period = 1000000.0 / h_freq  # 微秒
-                
-                # 根据最小垂直同步+后廊时间重新计算
-                min_v_sync_bp_lines = math.ceil(self.MIN_V_SYNC_BP / h_period)
-                v_back_porch_new = max(min_v_sync_bp_lines - v_sync_pulse, 1)
-                
-                # 检查是否收敛
-                if v_back_porch_new == v_back_porch:
-                    break
-                v_back_porch = v_back_porch_new
-        
-        # 最终计算
-        v_blanking = v_front_porch + v_sync_pulse + v_back_porch
-        v_total = v_active + v_blanking
-        refresh_rate = (pixel_clock * 1000000.0) / (h_total * v_total)
-        
-        # 返回所有计算结果
-        return {
-            'pixel_clock': round(pixel_clock, 2),
-            'refresh_rate': round(refresh_rate, 2),  # 添加计算出的刷新率
-            'h_total': h_total,
-            'h_blanking': h_blanking,
-            'h_front_porch': h_front_porch,
-            'h_sync_pulse': h_sync_pulse,
-            'h_back_porch': h_back_porch,
-            'v_total': v_total,
-            'v_blanking': v_blanking,
-            'v_front_porch': v_front_porch,
-            'v_sync_pulse': v_sync_pulse,
-            'v_back_porch': v_back_porch,
-        }
-
-
-
-    def _calculate_with_both_params(self, h_active: int, v_active: int,
-                                   refresh_rate: float, pixel_clock: float,
-                                   reduced_blanking: bool = False) -> dict:
-        """
-        同时使用像素时钟和刷新率计算时序参数
-        
-        这种模式下，用户同时指定像素时钟和刷新率，
-        系统会计算相应的时序参数，确保两者兼容。
-        
-        参数:
-            h_active: 水平有效像素
-            v_active: 垂直有效行数
-            refresh_rate: 刷新率 Hz
-            pixel_clock: 像素时钟频率 MHz
-            reduced_blanking: 是否使用 CVT-RB 模式
-            
-        返回:
-            包含所有时序参数的字典
-        """
-        import math
-        
-        # 步骤 1: 确保水平分辨率是 CELL_GRAN 的倍数
-        h_active_rounded = (h_active // self.CELL_GRAN) * self.CELL_GRAN
-        
-        # 步骤 2: 计算理论上的总像素和总行数
-        # 根据像素时钟和刷新率计算理论上的总像素和总行数
-        # pixel_clock (MHz) = h_total * v_total * refresh_rate / 1,000,000
-        # h_total * v_total = pixel_clock * 1,000,000 / refresh_rate
-        total_pixels_times_lines = (pixel_clock * 1000000.0) / refresh_rate
-        
-        # 步骤 3: 根据模式选择消隐参数
-        if reduced_blanking:
-            # CVT-RB 模式：使用固定的消隐参数
-            h_blanking = self.RB_H_BLANK
-            h_sync_pulse = self.RB_H_SYNC
-            h_back_porch = 80
-            h_front_porch = h_blanking - h_sync_pulse - h_back_porch
-            h_total = h_active_rounded + h_blanking
-            
-            # 垂直时序参数
-            v_sync_pulse = self.RB_V_SYNC
-            v_front_porch = self.MIN_V_PORCH
-            
-            # 计算垂直消隐
-            # 使用迭代方法计算垂直消隐，以满足给定的像素时钟和刷新率
-            v_back_porch = self.RB_MIN_V_BPORCH
-            v_blanking = v_front_porch + v_sync_pulse + v_back_porch
-            v_total = v_active + v_blanking
-            
-            # 迭代调整垂直消隐，使计算结果与输入参数匹配
-            for _ in range(10):  # 最多迭代 10 次
-                # 计算当前配置下的像素时钟
-                calculated_pixel_clock = (h_total * v_total * refresh_rate) / 1000000.0
-                
-                # 如果计算出的像素时钟与输入值接近，则停止迭代
-                if abs(calculated_pixel_clock - pixel_clock) < 0.01:
-                    break
-                
-                # 调整垂直总行数以匹配像素时钟
-                target_v_total = total_pixels_times_lines / h_total
-                v_total = int(round(target_v_total))
-                v_blanking = v_total - v_active
-                
-                # 确保垂直消隐至少包含前廊和同步脉冲
-                min_v_blanking = v_front_porch + v_sync_pulse + self.RB_MIN_V_BPORCH
-                if v_blanking < min_v_blanking:
-                    v_blanking = min_v_blanking
-                    v_total = v_active + v_blanking
-                
-                # 重新计算垂直后廊
-                v_back_porch = v_blanking - v_front_porch - v_sync_pulse
-            
-        else:
-            # 标准 CVT 模式：使用标准的消隐参数
-            # 根据分辨率选择合适的水平消隐
-            if h_active_rounded <= 1024:
-                h_blank_pixels = 256
-            elif h_active_rounded <= 1280:
-                h_blank_pixels = 320
-            elif h_active_rounded <= 1920:
-                h_blank_pixels = 280
-            else:
-                h_blank_pixels = 288
-            
-            h_blanking = ((h_blank_pixels + self.CELL_GRAN - 1) // self.CELL_GRAN) * self.CELL_GRAN
-            h_total = h_active_rounded + h_blanking
-            
-            # 水平同步脉冲
-            h_sync_pulse = int(round(h_blanking * self.H_SYNC_PERCENT / 100.0))
-            h_sync_pulse = ((h_sync_pulse + self.CELL_GRAN - 1) // self.CELL_GRAN) * self.CELL_GRAN
-            
-            # 水平后廊和前廊
-            h_back_porch = (h_blanking // 2) - (h_sync_pulse // 2)
-            h_back_porch = (h_back_porch // self.CELL_GRAN) * self.CELL_GRAN
-            h_front_porch = h_blanking - h_sync_pulse - h_back_porch
-            
-            # 垂直时序参数
-            v_front_porch = self.MIN_V_PORCH
-            v_sync_pulse = 4
-            
-            # 计算垂直消隐
-            # 使用迭代方法计算垂直消隐，以满足给定的像素时钟和刷新率
-            v_back_porch = 10  # 初始估算
-            v_blanking = v_front_porch + v_sync_pulse + v_back_porch
-            v_total = v_active + v_blanking
-            
-            # 迭代调整垂直消隐，使计算结果与输入参数匹配
-            for _ in range(10):  # 最多迭代 10 次
-                # 计算当前配置下的像素时钟
-                calculated_pixel_clock = (h_total * v_total * refresh_rate) / 1000000.0
-                
-                # 如果计算出的像素时钟与输入值接近，则停止迭代
-                if abs(calculated_pixel_clock - pixel_clock) < 0.01:
-                    break
-                
-                # 调整垂直总行数以匹配像素时钟
-                target_v_total = total_pixels_times_lines / h_total
-                v_total = int(round(target_v_total))
-                v_blanking = v_total - v_active
-                
-                # 确保垂直消隐至少包含前廊和同步脉冲
-                min_v_blanking = v_front_porch + v_sync_pulse + 1
-                if v_blanking < min_v_blanking:
-                    v_blanking = min_v_blanking
-                    v_total = v_active + v_blanking
-                
-                # 重新计算垂直后廊
-                v_back_porch = v_blanking - v_front_porch - v_sync_pulse
-        
-        # 最终计算
-        v_blanking = v_front_porch + v_sync_pulse + v_back_porch
-        v_total = v_active + v_blanking
-        
-        # 计算实际像素时钟（应该与输入值非常接近）
-        actual_pixel_clock = (h_total * v_total * refresh_rate) / 1000000.0
-        
-        # 返回所有计算结果
-        return {
-            'pixel_clock': round(pixel_clock, 2),  # 使用输入的像素时钟
-            'refresh_rate': round(refresh_rate, 2),  # 使用输入的刷新率
-            'h_total': h_total,
-            'h_blanking': h_blanking,
-            'h_front_porch': h_front_porch,
-            'h_sync_pulse': h_sync_pulse,
-            'h_back_porch': h_back_porch,
-            'v_total': v_total,
-            'v_blanking': v_blanking,
-            'v_front_porch': v_front_porch,
-            'v_sync_pulse': v_sync_pulse,
-            'v_back_porch': v_back_porch,
-        }
-
-
-from PyQt5.QtWidgets import (
-    QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QFormLayout,
-    QGroupBox, QSpinBox, QDoubleSpinBox, QCheckBox, QComboBox,
-    QPushButton, QTableWidget, QTableWidgetItem, QApplication
-)
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor
-
-
-class MainWindow(QMainWindow):
-    """
-    主窗口 UI 类
-    
-    提供 VESA 时序计算器的图形用户界面，包括：
-    - 左侧输入面板：参数输入和预设选择
-    - 右侧输出面板：计算结果显示
-    """
-    
-    def __init__(self):
-        """初始化主窗口和 UI 组件"""
-        super().__init__()
-        
-        # 创建计算器实例
-        self.calculator = VesaCalculator()
-        
-        # 设置窗口属性
-        self.setWindowTitle("VESA 视频时序计算器")
-        self.setMinimumSize(900, 600)
-        
-        # 创建主布局
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        
-        # 使用水平布局（左侧输入，右侧输出）
-        main_layout = QHBoxLayout()
-        central_widget.setLayout(main_layout)
-        
-        # 创建并添加输入面板
-        input_panel = self._create_input_panel()
-        main_layout.addWidget(input_panel)
-        
-        # 创建并添加输出面板
-        output_panel = self._create_output_panel()
-        main_layout.addWidget(output_panel)
-        
-        # 创建状态栏
-        self.statusBar().showMessage("就绪")
-        
-        # 连接信号槽
-        self._connect_signals()
-    
-    def _create_input_panel(self):
-        """
-        创建输入面板
-        
-        返回:
-            QGroupBox: 包含所有输入控件的面板
-        """
-        # 创建 GroupBox
-        group_box = QGroupBox("输入参数")
-        
-        # 使用表单布局
-        layout = QFormLayout()
-        
-        # 计算模式选择
-        self.mode_combobox = QComboBox()
-        self.mode_combobox.addItem("从刷新率计算像素时钟")
-        self.mode_combobox.addItem("从像素时钟计算刷新率")
-        self.mode_combobox.addItem("同时设置像素时钟和刷新率")
-        layout.addRow("计算模式:", self.mode_combobox)
-        
-        # 水平分辨率 SpinBox (640-7680, 默认 1920)
-        self.h_active_spinbox = QSpinBox()
-        self.h_active_spinbox.setRange(640, 7680)
-        self.h_active_spinbox.setValue(1920)
-        self.h_active_spinbox.setSuffix(" pixels")
-        layout.addRow("水平分辨率:", self.h_active_spinbox)
-        
-        # 垂直分辨率 SpinBox (480-4320, 默认 1080)
-        self.v_active_spinbox = QSpinBox()
-        self.v_active_spinbox.setRange(480, 4320)
-        self.v_active_spinbox.setValue(1080)
-        self.v_active_spinbox.setSuffix(" lines")
-        layout.addRow("垂直分辨率:", self.v_active_spinbox)
-        
-        # 刷新率 DoubleSpinBox (24-240, 默认 60.0)
-        self.refresh_rate_spinbox = QDoubleSpinBox()
-        self.refresh_rate_spinbox.setRange(24.0, 240.0)
-        self.refresh_rate_spinbox.setValue(60.0)
-        self.refresh_rate_spinbox.setDecimals(2)
-        self.refresh_rate_spinbox.setSuffix(" Hz")
-        layout.addRow("刷新率:", self.refresh_rate_spinbox)
-        
-        # 像素时钟 DoubleSpinBox (10-1000 MHz)
-        self.pixel_clock_spinbox = QDoubleSpinBox()
-        self.pixel_clock_spinbox.setRange(10.0, 1000.0)
-        self.pixel_clock_spinbox.setValue(148.5)
-        self.pixel_clock_spinbox.setDecimals(2)
-        self.pixel_clock_spinbox.setSuffix(" MHz")
-        self.pixel_clock_spinbox.setEnabled(False)  # 默认禁用
-        layout.addRow("像素时钟:", self.pixel_clock_spinbox)
-        
-        # Reduced Blanking 复选框
-        self.reduced_blanking_checkbox = QCheckBox()
-        layout.addRow("Reduced Blanking:", self.reduced_blanking_checkbox)
-        
-        # 预设下拉菜单
-        self.preset_combobox = QComboBox()
-        self.preset_combobox.addItem("选择预设...")
-        self.preset_combobox.addItem("1280x720@60Hz")
-        self.preset_combobox.addItem("1920x1080@60Hz")
-        self.preset_combobox.addItem("2560x1440@60Hz")
-        self.preset_combobox.addItem("3840x2160@60Hz")
-        self.preset_combobox.addItem("1920x1200@60Hz")
-        layout.addRow("预设:", self.preset_combobox)
-        
-        # 计算按钮
-        self.calculate_button = QPushButton("计算")
-        layout.addRow("", self.calculate_button)
-        
-        group_box.setLayout(layout)
-        return group_box
-    
-    def _create_output_panel(self):
-        """
-        创建输出面板
-        
-        返回:
-            QGroupBox: 包含结果表格和复制按钮的面板
-        """
-        # 创建 GroupBox
-        group_box = QGroupBox("计算结果")
-        
-        # 使用垂直布局
-        layout = QVBoxLayout()
-        
-        # 创建结果表格 (11 行 x 2 列)
-        self.results_table = QTableWidget()
-        self.results_table.setRowCount(11)
-        self.results_table.setColumnCount(2)
-        self.results_table.setHorizontalHeaderLabels(["参数", "数值"])
-        
-        # 设置表格属性
-        self.results_table.horizontalHeader().setStretchLastSection(True)
-        self.results_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        
-        # 初始化表格行标签
-        parameter_names = [
-            "像素时钟",
-            "水平总像素",
-            "水平消隐区",
-            "水平前廊",
-            "水平同步脉冲",
-            "水平后廊",
-            "垂直总行数",
-            "垂直消隐区",
-            "垂直前廊",
-            "垂直同步脉冲",
-            "垂直后廊"
-        ]
-        
-        for i, name in enumerate(parameter_names):
-            self.results_table.setItem(i, 0, QTableWidgetItem(name))
-            self.results_table.setItem(i, 1, QTableWidgetItem(""))
-        
-        layout.addWidget(self.results_table)
-        
-        # 复制按钮
-        self.copy_button = QPushButton("复制所有结果")
-        layout.addWidget(self.copy_button)
-        
-        # 生成 RTL 代码按钮
-        self.generate_rtl_button = QPushButton("生成 RTL 代码")
-        self.generate_rtl_button.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-weight: bold; }")
-        layout.addWidget(self.generate_rtl_button)
-        
-        group_box.setLayout(layout)
-        return group_box
-
-    def _connect_signals(self):
-        """连接所有信号槽"""
-        # 计算模式切换事件
-        self.mode_combobox.currentIndexChanged.connect(self._on_mode_changed)
-        
-        # 计算按钮点击事件
-        self.calculate_button.clicked.connect(self._on_calculate)
-        
-        # 输入控件变化事件（实时计算）
-        self.h_active_spinbox.valueChanged.connect(self._on_input_changed)
-        self.v_active_spinbox.valueChanged.connect(self._on_input_changed)
-        self.refresh_rate_spinbox.valueChanged.connect(self._on_input_changed)
-        self.pixel_clock_spinbox.valueChanged.connect(self._on_input_changed)
-        self.reduced_blanking_checkbox.stateChanged.connect(self._on_input_changed)
-        
-        # 预设选择事件
-        self.preset_combobox.currentIndexChanged.connect(self._on_preset_selected)
-        
-        # 复制按钮点击事件
-        self.copy_button.clicked.connect(self._copy_results)
-        
-        # 生成 RTL 代码按钮点击事件
-        self.generate_rtl_button.clicked.connect(self._generate_rtl_code)
-    
-    def _on_mode_changed(self, index: int):
-        """
-        计算模式切换事件处理
-        
-        根据选择的模式启用/禁用相应的输入控件。
-        
-        参数:
-            index: 模式下拉菜单的索引
-                   0 = 从刷新率计算像素时钟
-                   1 = 从像素时钟计算刷新率
-                   2 = 同时设置像素时钟和刷新率
-        """
-        if index == 0:
-            # 模式 0: 从刷新率计算像素时钟
-            self.refresh_rate_spinbox.setEnabled(True)
-            self.pixel_clock_spinbox.setEnabled(False)
-        elif index == 1:
-            # 模式 1: 从像素时钟计算刷新率
-            self.refresh_rate_spinbox.setEnabled(False)
-            self.pixel_clock_spinbox.setEnabled(True)
-        else:
-            # 模式 2: 同时设置像素时钟和刷新率
-            self.refresh_rate_spinbox.setEnabled(True)
-            self.pixel_clock_spinbox.setEnabled(True)
-        
-        # 触发重新计算
-        self._on_calculate()
-    
-    def _on_calculate(self):
-        """
-        计算按钮点击事件处理
-        
-        获取输入参数，调用 VesaCalculator 进行计算，
-        并更新结果表格显示。处理验证错误和计算异常。
-        """
-        try:
-            # 获取输入参数
-            h_active = self.h_active_spinbox.value()
-            v_active = self.v_active_spinbox.value()
-            reduced_blanking = self.reduced_blanking_checkbox.isChecked()
-            
-            # 根据模式选择参数
-            mode = self.mode_combobox.currentIndex()
-            
-            if mode == 0:
-                # 模式 0: 从刷新率计算像素时钟
-                refresh_rate = self.refresh_rate_spinbox.value()
-                results = self.calculator.calculate(
-                    h_active=h_active,
-                    v_active=v_active,
-                    refresh_rate=refresh_rate,
-                    reduced_blanking=reduced_blanking
-                )
-            elif mode == 1:
-                # 模式 1: 从像素时钟计算刷新率
-                pixel_clock = self.pixel_clock_spinbox.value()
-                results = self.calculator.calculate(
-                    h_active=h_active,
-                    v_active=v_active,
-                    pixel_clock=pixel_clock,
-                    reduced_blanking=reduced_blanking
-                )
-            else:
-                # 模式 2: 同时设置像素时钟和刷新率
-                refresh_rate = self.refresh_rate_spinbox.value()
-                pixel_clock = self.pixel_clock_spinbox.value()
-                results = self.calculator.calculate(
-                    h_active=h_active,
-                    v_active=v_active,
-                    refresh_rate=refresh_rate,
-                    pixel_clock=pixel_clock,
-                    reduced_blanking=reduced_blanking
-                )
-            
-            # 检查是否有错误
-            if 'error' in results and results['error']:
-                # 显示验证错误
-                self._show_error(results['message'])
-            else:
-                # 更新结果表格
-                self._update_results_table(results)
-                
-                # 如果是反向计算或双参数计算，更新显示
-                if mode == 1 and 'refresh_rate' in results:
-                    # 临时禁用信号避免循环触发
-                    self.refresh_rate_spinbox.blockSignals(True)
-                    self.refresh_rate_spinbox.setValue(results['refresh_rate'])
-                    self.refresh_rate_spinbox.blockSignals(False)
-                elif mode == 2:
-                    # 模式 2: 双参数计算，不需要更新显示，因为两个参数都是输入
-                    pass
-                
-                # 恢复状态栏正常样式（清除之前的错误样式）
-                self.statusBar().setStyleSheet("")
-                self.statusBar().showMessage("计算完成", 3000)
-        
-        except Exception as e:
-            # 捕获任何未预期的异常，显示友好的错误消息
-            error_message = f"计算过程中发生意外错误: {str(e)}"
-            self._show_error(error_message)
-    
-    def _on_input_changed(self):
-        """
-        输入参数变化事件处理
-        
-        当任何输入控件的值发生变化时，自动触发计算。
-        实现实时计算功能（需求 3.1）。
-        """
-        # 直接调用计算方法
-        self._on_calculate()
-    
-    def _on_preset_selected(self, index: int):
-        """
-        预设选择事件处理
-        
-        根据选择的预设填充输入框并触发计算。
-        
-        参数:
-            index: 预设下拉菜单的索引
-        """
-        # 索引 0 是 "选择预设..." 提示文本，跳过
-        if index == 0:
-            return
-        
-        # 定义预设参数
-        presets = {
-            1: (1280, 720, 60.0),    # 1280x720@60Hz
-            2: (1920, 1080, 60.0),   # 1920x1080@60Hz
-            3: (2560, 1440, 60.0),   # 2560x1440@60Hz
-            4: (3840, 2160, 60.0),   # 3840x2160@60Hz
-            5: (1920, 1200, 60.0),   # 1920x1200@60Hz
-        }
-        
-        # 获取预设参数
-        if index in presets:
-            h_active, v_active, refresh_rate = presets[index]
-            
-            # 临时断开信号，避免多次触发计算
-            self.h_active_spinbox.blockSignals(True)
-            self.v_active_spinbox.blockSignals(True)
-            self.refresh_rate_spinbox.blockSignals(True)
-            self.pixel_clock_spinbox.blockSignals(True)
-            
-            # 填充输入框
-            self.h_active_spinbox.setValue(h_active)
-            self.v_active_spinbox.setValue(v_active)
-            self.refresh_rate_spinbox.setValue(refresh_rate)
-            
-            # 根据预设计算像素时钟
-            # 使用标准 CVT 算法计算像素时钟
-            temp_results = self.calculator.calculate(
-                h_active=h_active,
-                v_active=v_active,
-                refresh_rate=refresh_rate,
-                reduced_blanking=self.reduced_blanking_checkbox.isChecked()
-            )
-            
-            if 'pixel_clock' in temp_results and not temp_results.get('error', False):
-                self.pixel_clock_spinbox.setValue(temp_results['pixel_clock'])
-            
-            # 恢复信号
-            self.h_active_spinbox.blockSignals(False)
-            self.v_active_spinbox.blockSignals(False)
-            self.refresh_rate_spinbox.blockSignals(False)
-            self.pixel_clock_spinbox.blockSignals(False)
-            
-            # 触发计算
-            self._on_calculate()
-    
-    def _update_results_table(self, results: dict):
-        """
-        更新结果表格显示
-        
-        将计算结果填充到表格中，格式化数值并添加单位。
-        
-        参数:
-            results: 包含所有时序参数的字典
-        """
-        # 定义参数键和单位的映射
-        parameters = [
-            ('pixel_clock', 'MHz'),
-            ('h_total', 'pixels'),
-            ('h_blanking', 'pixels'),
-            ('h_front_porch', 'pixels'),
-            ('h_sync_pulse', 'pixels'),
-            ('h_back_porch', 'pixels'),
-            ('v_total', 'lines'),
-            ('v_blanking', 'lines'),
-            ('v_front_porch', 'lines'),
-            ('v_sync_pulse', 'lines'),
-            ('v_back_porch', 'lines'),
-        ]
-        
-        # 填充表格
-        for i, (key, unit) in enumerate(parameters):
-            if key in results:
-                value = results[key]
-                # 格式化数值：浮点数保留两位小数
-                if isinstance(value, float):
-                    formatted_value = f"{value:.2f} {unit}"
-                else:
-                    formatted_value = f"{value} {unit}"
-                
-                self.results_table.item(i, 1).setText(formatted_value)
-    
-    def _show_error(self, message: str):
-        """
-        显示错误消息
-        
-        在输出区域和状态栏显示错误信息，使用红色文本突出显示。
-        
-        参数:
-            message: 错误消息文本
-        """
-        # 在状态栏显示错误消息（红色）
-        self.statusBar().showMessage(f"错误: {message}", 5000)
-        self.statusBar().setStyleSheet("QStatusBar { color: red; }")
-        
-        # 在输出表格的第一行显示错误消息
-        # 清空第一列，在第二列显示红色错误文本
-        error_item = QTableWidgetItem(f"⚠ 错误: {message}")
-        error_item.setForeground(Qt.red)
-        self.results_table.setItem(0, 1, error_item)
-        
-        # 清空其他行
-        for i in range(1, 11):
-            self.results_table.item(i, 1).setText("")
-        
-        # 5 秒后恢复状态栏正常样式
-        from PyQt5.QtCore import QTimer
-        QTimer.singleShot(5000, lambda: self.statusBar().setStyleSheet(""))
-    
-    def _copy_results(self):
-        """
-        复制结果到剪贴板
-        
-        将所有计算结果格式化为文本并复制到系统剪贴板。
-        格式：每行一个参数，格式为"参数名称: 数值 单位"
-        """
-        # 检查是否有计算结果
-        has_results = False
-        for i in range(11):
-            if self.results_table.item(i, 1).text():
-                has_results = True
-                break
-        
-        if not has_results:
-            self.statusBar().showMessage("没有可复制的内容", 3000)
-            return
-        
-        # 构建复制文本
-        lines = []
-        for i in range(11):
-            param_name = self.results_table.item(i, 0).text()
-            param_value = self.results_table.item(i, 1).text()
-            if param_value:  # 只复制有值的行
-                lines.append(f"{param_name}: {param_value}")
-        
-        # 复制到剪贴板
-        clipboard = QApplication.clipboard()
-        clipboard.setText("\n".join(lines))
-        
-        # 显示确认消息
-        self.statusBar().showMessage("结果已复制到剪贴板", 3000)
-    
-    def _generate_rtl_code(self):
-        """
-        生成 RTL 代码
-        
-        根据当前的计算结果生成 Verilog RTL 代码和测试平台，
-        保存到 ./output 目录。
-        """
-        import os
-        from vesa_timing_rtl_template import generate_verilog_rtl, generate_testbench
-        
-        # 检查是否有计算结果
-        has_results = False
-        for i in range(11):
-            if self.results_table.item(i, 1).text():
-                has_results = True
-                break
-        
-        if not has_results:
-            self.statusBar().showMessage("请先计算时序参数", 3000)
-            return
-        
-        try:
-            # 收集当前的时序参数
-            timing_params = {}
-            
-            # 从输入框获取基本参数
-            timing_params['h_active'] = self.h_active_spinbox.value()
-            timing_params['v_active'] = self.v_active_spinbox.value()
-            
-            # 从结果表格提取参数
-            param_keys = [
-                'pixel_clock', 'h_total', 'h_blanking', 'h_front_porch',
-                'h_sync_pulse', 'h_back_porch', 'v_total', 'v_blanking',
-                'v_front_porch', 'v_sync_pulse', 'v_back_porch'
-            ]
-            
-            for i, key in enumerate(param_keys):
-                value_text = self.results_table.item(i, 1).text()
-                if value_text:
-                    # 提取数值（去除单位）
-                    value_str = value_text.split()[0]
-                    if key == 'pixel_clock':
-                        timing_params[key] = float(value_str)
-                    else:
-                        timing_params[key] = int(value_str)
-            
-            # 获取刷新率
-            mode = self.mode_combobox.currentIndex()
-            if mode == 0:
-                timing_params['refresh_rate'] = self.refresh_rate_spinbox.value()
-            else:
-                # 反向计算模式，刷新率已经在结果中
-                timing_params['refresh_rate'] = self.refresh_rate_spinbox.value()
-            
-            # 创建输出目录
-            output_dir = "./output"
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-            
-            # 生成文件名
-            h_active = timing_params['h_active']
-            v_active = timing_params['v_active']
-            refresh_rate = timing_params['refresh_rate']
-            module_name = f"vesa_timing_{h_active}x{v_active}_{int(refresh_rate)}hz"
-            
-            # 生成 RTL 代码
-            rtl_code = generate_verilog_rtl(timing_params, module_name)
-            rtl_filename = os.path.join(output_dir, f"{module_name}.v")
-            
-            with open(rtl_filename, 'w', encoding='utf-8') as f:
-                f.write(rtl_code)
-            
-            # 生成测试平台
-            tb_code = generate_testbench(timing_params, module_name)
-            tb_filename = os.path.join(output_dir, f"tb_{module_name}.v")
-            
-            with open(tb_filename, 'w', encoding='utf-8') as f:
-                f.write(tb_code)
-            
-            # 显示成功消息
-            success_msg = f"RTL 代码已生成:\n{rtl_filename}\n{tb_filename}"
-            self.statusBar().showMessage(f"RTL 代码已生成到 {output_dir} 目录", 5000)
-            
-            # 弹出成功对话框
-            from PyQt5.QtWidgets import QMessageBox
-            msg_box = QMessageBox(self)
-            msg_box.setIcon(QMessageBox.Information)
-            msg_box.setWindowTitle("生成成功")
-            msg_box.setText("RTL 代码生成成功！")
-            msg_box.setInformativeText(success_msg)
-            msg_box.setStandardButtons(QMessageBox.Ok)
-            msg_box.exec_()
-            
-        except Exception as e:
-            error_message = f"生成 RTL 代码时发生错误: {str(e)}"
-            self.statusBar().showMessage(error_message, 5000)
-            self.statusBar().setStyleSheet("QStatusBar { color: red; }")
-
-
-if __name__ == "__main__":
-    """
-    应用程序入口点
-    
-    初始化 Qt 应用程序，创建并显示主窗口，启动事件循环。
-    """
-    import sys
-    
-    # 创建 QApplication 实例
-    app = QApplication(sys.argv)
-    
-    # 设置应用程序属性
-    app.setApplicationName("VESA 视频时序计算器")
-    app.setOrganizationName("VESA Tools")
-    
-    # 创建并显示主窗口
-    window = MainWindow()
-    window.show()
-    
-    # 启动事件循环
-    sys.exit(app.exec_())
+"""
+VESA 视频时序计算器
+
+基于 VESA CVT (Coordinated Video Timing) 标准计算视频时序参数的桌面应用程序。
+
+计算逻辑位于 vesa_timing_core（无 GUI 依赖）；本模块只包含 Qt 界面，
+并为既有调用方重新导出 TimingParameters 和 VesaCalculator。
+"""
+
+import sys
+from contextlib import contextmanager
+
+from vesa_timing_core import TimingParameters, VesaCalculator
+
+from PyQt5.QtWidgets import (
+    QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QFormLayout,
+    QGroupBox, QSpinBox, QDoubleSpinBox, QCheckBox, QComboBox,
+    QPushButton, QTableWidget, QTableWidgetItem, QApplication
+)
+from PyQt5.QtCore import Qt, QSignalBlocker, QTimer
+from PyQt5.QtGui import QColor
+
+# 应用程序标识（窗口标题与 QApplication 属性共用一份定义）
+APP_NAME = "VESA 视频时序计算器"
+ORG_NAME = "VESA Tools"
+
+# 预设时序配置 (h_active, v_active, refresh_rate, reduced_blanking)
+# 导入时构建，预设选择只做 O(1) 元组索引，不解析下拉框文本
+PRESETS = (
+    (1280, 720, 60.0, False),    # 1280x720@60Hz
+    (1920, 1080, 60.0, False),   # 1920x1080@60Hz
+    (2560, 1440, 60.0, False),   # 2560x1440@60Hz
+    (3840, 2160, 60.0, False),   # 3840x2160@60Hz
+    (1920, 1200, 60.0, False),   # 1920x1200@60Hz
+)
+
+
+class MainWindow(QMainWindow):
+    """
+    主窗口 UI 类
+    
+    提供 VESA 时序计算器的图形用户界面，包括：
+    - 左侧输入面板：参数输入和预设选择
+    - 右侧输出面板：计算结果显示
+    """
+
+    # 状态栏样式（常量串，错误/恢复时复用同一对象，免去重复构串）
+    _STYLE_ERROR = "QStatusBar { color: red; }"
+    _STYLE_NORMAL = ""
+
+    # 结果表格各行的参数名称（静态 UI 文本，类级常量；
+    # 复制等只读场景直接用它，不再回表格读第一列单元格）
+    PARAM_NAMES = (
+        "像素时钟",
+        "水平总像素",
+        "水平消隐区",
+        "水平前廊",
+        "水平同步脉冲",
+        "水平后廊",
+        "垂直总行数",
+        "垂直消隐区",
+        "垂直前廊",
+        "垂直同步脉冲",
+        "垂直后廊",
+    )
+
+    # 结果表格各行对应的结果键和格式模板（类级常量，避免每次更新
+    # 重建列表；模板在此处预编排好单位，更新时一次 format 调用出串）
+    RESULT_FIELDS = (
+        ('pixel_clock', '{:.2f} MHz'),
+        ('h_total', '{} pixels'),
+        ('h_blanking', '{} pixels'),
+        ('h_front_porch', '{} pixels'),
+        ('h_sync_pulse', '{} pixels'),
+        ('h_back_porch', '{} pixels'),
+        ('v_total', '{} lines'),
+        ('v_blanking', '{} lines'),
+        ('v_front_porch', '{} lines'),
+        ('v_sync_pulse', '{} lines'),
+        ('v_back_porch', '{} lines'),
+    )
+
+    def __init__(self):
+        """初始化主窗口和 UI 组件"""
+        super().__init__()
+        
+        # 创建计算器实例
+        self.calculator = VesaCalculator()
+        
+        # 预设输入是固定的，启动时把两种消隐模式的结果都灌进
+        # 计算缓存，之后预设点击路径的 calculate() 只是一次缓存命中，
+        # 无需在 GUI 层再维护一份按索引的结果表
+        for preset_h, preset_v, preset_r, preset_rb in PRESETS:
+            for rb_variant in (preset_rb, not preset_rb):
+                self.calculator.calculate(
+                    h_active=preset_h, v_active=preset_v,
+                    refresh_rate=preset_r, reduced_blanking=rb_variant)
+
+        # 最近一次成功计算的原始结果（供测试/外部直接读取，免去表格往返）
+        self.last_result = None
+        
+        # 最近一次成功计算的输入元组：防抖到期后如果输入的最终状态
+        # 与上次相同（如输入又改回原值），直接跳过整个重算和表格更新
+        self._last_inputs = None
+        
+        # 设置窗口属性
+        self.setWindowTitle(APP_NAME)
+        self.setMinimumSize(900, 600)
+        
+        # 创建主布局
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        
+        # 使用水平布局（左侧输入，右侧输出）
+        main_layout = QHBoxLayout()
+        central_widget.setLayout(main_layout)
+        
+        # 创建并添加输入面板
+        input_panel = self._create_input_panel()
+        main_layout.addWidget(input_panel)
+        
+        # 创建并添加输出面板
+        output_panel = self._create_output_panel()
+        main_layout.addWidget(output_panel)
+        
+        # 创建状态栏并缓存句柄：statusBar() 每次调用都要跨一次
+        # Python/C++ 边界，而状态栏对象在窗口生命周期内不变
+        self._status_bar = self.statusBar()
+        self._status_bar.showMessage("就绪")
+
+        # 同理缓存剪贴板句柄：应用级单例，按复制一次取一次没有意义
+        self._clipboard = QApplication.clipboard()
+        
+        # 输入防抖定时器：100 ms 内的连续输入只触发最后一次计算
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(50)
+        self._debounce.timeout.connect(self._on_calculate)
+
+        # 状态栏错误样式恢复定时器：复用同一个 QTimer 对象，
+        # 不再每次出错都临时分配 QTimer 和 lambda 闭包；
+        # 连续出错时 start() 会重新倒计时，行为正好符合预期
+        self._error_reset_timer = QTimer(self)
+        self._error_reset_timer.setSingleShot(True)
+        self._error_reset_timer.setInterval(5000)
+        self._error_reset_timer.timeout.connect(self._reset_statusbar_style)
+
+        # 连接信号槽
+        self._connect_signals()
+    
+    def _create_input_panel(self):
+        """
+        创建输入面板
+        
+        返回:
+            QGroupBox: 包含所有输入控件的面板
+        """
+        # 创建 GroupBox
+        group_box = QGroupBox("输入参数")
+        
+        # 使用表单布局
+        layout = QFormLayout()
+        
+        # 计算模式选择
+        self.mode_combobox = QComboBox()
+        self.mode_combobox.addItem("从刷新率计算像素时钟")
+        self.mode_combobox.addItem("从像素时钟计算刷新率")
+        self.mode_combobox.addItem("同时设置像素时钟和刷新率")
+        layout.addRow("计算模式:", self.mode_combobox)
+        
+        # 水平分辨率 SpinBox (640-7680, 默认 1920)
+        self.h_active_spinbox = QSpinBox()
+        self.h_active_spinbox.setRange(640, 7680)
+        self.h_active_spinbox.setValue(1920)
+        self.h_active_spinbox.setSuffix(" pixels")
+        layout.addRow("水平分辨率:", self.h_active_spinbox)
+        
+        # 垂直分辨率 SpinBox (480-4320, 默认 1080)
+        self.v_active_spinbox = QSpinBox()
+        self.v_active_spinbox.setRange(480, 4320)
+        self.v_active_spinbox.setValue(1080)
+        self.v_active_spinbox.setSuffix(" lines")
+        layout.addRow("垂直分辨率:", self.v_active_spinbox)
+        
+        # 刷新率 DoubleSpinBox (24-240, 默认 60.0)
+        self.refresh_rate_spinbox = QDoubleSpinBox()
+        self.refresh_rate_spinbox.setRange(24.0, 240.0)
+        self.refresh_rate_spinbox.setValue(60.0)
+        self.refresh_rate_spinbox.setDecimals(2)
+        self.refresh_rate_spinbox.setSuffix(" Hz")
+        layout.addRow("刷新率:", self.refresh_rate_spinbox)
+        
+        # 像素时钟 DoubleSpinBox (10-1000 MHz)
+        self.pixel_clock_spinbox = QDoubleSpinBox()
+        self.pixel_clock_spinbox.setRange(10.0, 1000.0)
+        self.pixel_clock_spinbox.setValue(148.5)
+        self.pixel_clock_spinbox.setDecimals(2)
+        self.pixel_clock_spinbox.setSuffix(" MHz")
+        self.pixel_clock_spinbox.setEnabled(False)  # 默认禁用
+        layout.addRow("像素时钟:", self.pixel_clock_spinbox)
+        
+        # Reduced Blanking 复选框
+        self.reduced_blanking_checkbox = QCheckBox()
+        layout.addRow("Reduced Blanking:", self.reduced_blanking_checkbox)
+        
+        # 预设下拉菜单（由 PRESETS 查找表生成）
+        self.preset_combobox = QComboBox()
+        self.preset_combobox.addItem("选择预设...")
+        for h, v, r, rb in PRESETS:
+            self.preset_combobox.addItem(f"{h}x{v}@{int(r)}Hz{' RB' if rb else ''}")
+        layout.addRow("预设:", self.preset_combobox)
+        
+        # 计算按钮
+        self.calculate_button = QPushButton("计算")
+        layout.addRow("", self.calculate_button)
+        
+        group_box.setLayout(layout)
+        return group_box
+    
+    def _create_output_panel(self):
+        """
+        创建输出面板
+        
+        返回:
+            QGroupBox: 包含结果表格和复制按钮的面板
+        """
+        # 创建 GroupBox
+        group_box = QGroupBox("计算结果")
+        
+        # 使用垂直布局
+        layout = QVBoxLayout()
+        
+        # 创建结果表格 (11 行 x 2 列)
+        self.results_table = QTableWidget()
+        self.results_table.setRowCount(len(self.PARAM_NAMES))
+        self.results_table.setColumnCount(2)
+        self.results_table.setHorizontalHeaderLabels(["参数", "数值"])
+        
+        # 设置表格属性
+        self.results_table.horizontalHeader().setStretchLastSection(True)
+        self.results_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        
+        # 初始化表格行标签
+        for i, name in enumerate(self.PARAM_NAMES):
+            self.results_table.setItem(i, 0, QTableWidgetItem(name))
+            self.results_table.setItem(i, 1, QTableWidgetItem(""))
+        
+        # 缓存数值列的条目引用和上次显示的文本：
+        # 每次更新省掉 11 次 item() 跨 Python/C++ 边界的查找，
+        # 文本未变化的行直接跳过 setText
+        self._result_items = [self.results_table.item(i, 1)
+                              for i in range(len(self.PARAM_NAMES))]
+        self._last_values = [None] * len(self.PARAM_NAMES)
+
+        # 记录数值列的默认前景画刷，以及第一行当前是否被错误文本
+        # 占用（红色前景）；下次成功计算时据此恢复默认颜色
+        self._default_foreground = self._result_items[0].foreground()
+        self._error_row_active = False
+
+        # 预渲染复制文本里每行的 "参数名: " 前缀，复制时只剩一次拼接
+        self._param_prefixes = tuple(f"{name}: " for name in self.PARAM_NAMES)
+        
+        layout.addWidget(self.results_table)
+        
+        # 复制按钮
+        self.copy_button = QPushButton("复制所有结果")
+        layout.addWidget(self.copy_button)
+        
+        # 生成 RTL 代码按钮
+        self.generate_rtl_button = QPushButton("生成 RTL 代码")
+        self.generate_rtl_button.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-weight: bold; }")
+        layout.addWidget(self.generate_rtl_button)
+        
+        group_box.setLayout(layout)
+        return group_box
+
+    def _connect_signals(self):
+        """连接所有信号槽"""
+        # 计算模式切换事件
+        self.mode_combobox.currentIndexChanged.connect(self._on_mode_changed)
+        
+        # 计算按钮点击事件
+        self.calculate_button.clicked.connect(self._on_calculate)
+        
+        # 输入控件变化事件（实时计算）
+        self.h_active_spinbox.valueChanged.connect(self._on_input_changed)
+        self.v_active_spinbox.valueChanged.connect(self._on_input_changed)
+        self.refresh_rate_spinbox.valueChanged.connect(self._on_input_changed)
+        self.pixel_clock_spinbox.valueChanged.connect(self._on_input_changed)
+        self.reduced_blanking_checkbox.stateChanged.connect(self._on_input_changed)
+        
+        # 预设选择事件
+        self.preset_combobox.currentIndexChanged.connect(self._on_preset_selected)
+        
+        # 复制按钮点击事件
+        self.copy_button.clicked.connect(self._copy_results)
+        
+        # 生成 RTL 代码按钮点击事件
+        self.generate_rtl_button.clicked.connect(self._generate_rtl_code)
+    
+    def _on_mode_changed(self, index: int):
+        """
+        计算模式切换事件处理
+        
+        根据选择的模式启用/禁用相应的输入控件。
+        
+        参数:
+            index: 模式下拉菜单的索引
+                   0 = 从刷新率计算像素时钟
+                   1 = 从像素时钟计算刷新率
+                   2 = 同时设置像素时钟和刷新率
+        """
+        if index == 0:
+            # 模式 0: 从刷新率计算像素时钟
+            self.refresh_rate_spinbox.setEnabled(True)
+            self.pixel_clock_spinbox.setEnabled(False)
+        elif index == 1:
+            # 模式 1: 从像素时钟计算刷新率
+            self.refresh_rate_spinbox.setEnabled(False)
+            self.pixel_clock_spinbox.setEnabled(True)
+        else:
+            # 模式 2: 同时设置像素时钟和刷新率
+            self.refresh_rate_spinbox.setEnabled(True)
+            self.pixel_clock_spinbox.setEnabled(True)
+        
+        # 触发重新计算
+        self._on_calculate()
+    
+    def _on_calculate(self):
+        """
+        计算按钮点击事件处理
+        
+        获取输入参数，调用 VesaCalculator 进行计算，
+        并更新结果表格显示。处理验证错误和计算异常。
+        """
+        try:
+            # 获取输入参数
+            h_active = self.h_active_spinbox.value()
+            v_active = self.v_active_spinbox.value()
+            reduced_blanking = self.reduced_blanking_checkbox.isChecked()
+            
+            # 根据模式选择参数
+            mode = self.mode_combobox.currentIndex()
+            
+            # 输入最终状态与上次成功计算相同时直接返回（无操作编辑）
+            input_key = (h_active, v_active, reduced_blanking, mode,
+                         self.refresh_rate_spinbox.value(),
+                         self.pixel_clock_spinbox.value())
+            if input_key == self._last_inputs:
+                return
+            
+            if mode == 0:
+                # 模式 0: 从刷新率计算像素时钟
+                refresh_rate = self.refresh_rate_spinbox.value()
+                results = self.calculator.calculate(
+                    h_active=h_active,
+                    v_active=v_active,
+                    refresh_rate=refresh_rate,
+                    reduced_blanking=reduced_blanking
+                )
+            elif mode == 1:
+                # 模式 1: 从像素时钟计算刷新率
+                pixel_clock = self.pixel_clock_spinbox.value()
+                results = self.calculator.calculate(
+                    h_active=h_active,
+                    v_active=v_active,
+                    pixel_clock=pixel_clock,
+                    reduced_blanking=reduced_blanking
+                )
+            else:
+                # 模式 2: 同时设置像素时钟和刷新率
+                refresh_rate = self.refresh_rate_spinbox.value()
+                pixel_clock = self.pixel_clock_spinbox.value()
+                results = self.calculator.calculate(
+                    h_active=h_active,
+                    v_active=v_active,
+                    refresh_rate=refresh_rate,
+                    pixel_clock=pixel_clock,
+                    reduced_blanking=reduced_blanking
+                )
+            
+            # 检查是否有错误
+            if 'error' in results and results['error']:
+                # 显示验证错误
+                self._show_error(results['message'])
+            else:
+                # 缓存原始结果，测试可直接读取数值而无需解析表格文本
+                self.last_result = results
+                self._last_inputs = input_key
+
+                # 更新结果表格
+                self._update_results_table(results)
+                
+                # 如果是反向计算或双参数计算，更新显示
+                if mode == 1 and 'refresh_rate' in results:
+                    # 仅在显示精度（2 位小数）内确有变化时回写，
+                    # 避免每次按键都驱动一遍 Qt 的值更新/重绘机制
+                    new_rr = results['refresh_rate']
+                    if abs(self.refresh_rate_spinbox.value() - new_rr) >= 0.005:
+                        # 临时禁用信号避免循环触发（QSignalBlocker 异常安全）
+                        with QSignalBlocker(self.refresh_rate_spinbox):
+                            self.refresh_rate_spinbox.setValue(new_rr)
+                elif mode == 2:
+                    # 模式 2: 双参数计算，不需要更新显示，因为两个参数都是输入
+                    pass
+                
+                # 恢复状态栏正常样式（清除之前的错误样式）
+                self._status_bar.setStyleSheet(self._STYLE_NORMAL)
+                self._status_bar.showMessage("计算完成", 3000)
+        
+        except Exception as e:
+            # 捕获任何未预期的异常，显示友好的错误消息
+            error_message = f"计算过程中发生意外错误: {str(e)}"
+            self._show_error(error_message)
+    
+    def _on_input_changed(self):
+        """
+        输入参数变化事件处理
+        
+        当任何输入控件的值发生变化时，自动触发计算。
+        实现实时计算功能（需求 3.1）。
+        
+        通过单次触发定时器防抖：快速连续修改（如拖动 SpinBox）
+        只在停止输入 50 ms 后计算一次，避免级联重算。
+        """
+        self._debounce.start()
+    
+    def _on_preset_selected(self, index: int):
+        """
+        预设选择事件处理
+        
+        根据选择的预设填充输入框并触发计算。
+        
+        参数:
+            index: 预设下拉菜单的索引
+        """
+        # 索引 0 是 "选择预设..." 提示文本，跳过
+        if index == 0:
+            return
+        
+        # 按索引直接查表（索引 0 为提示项，预设从 1 开始）
+        if index <= len(PRESETS):
+            h_active, v_active, refresh_rate, reduced_blanking = PRESETS[index - 1]
+            
+            # 临时断开信号，避免每个 setValue 都触发一次完整计算；
+            # QSignalBlocker 在异常时也保证恢复，不会把信号永久卡在屏蔽态
+            with QSignalBlocker(self.h_active_spinbox), \
+                 QSignalBlocker(self.v_active_spinbox), \
+                 QSignalBlocker(self.refresh_rate_spinbox), \
+                 QSignalBlocker(self.pixel_clock_spinbox), \
+                 QSignalBlocker(self.reduced_blanking_checkbox):
+                # 填充输入框
+                self.h_active_spinbox.setValue(h_active)
+                self.v_active_spinbox.setValue(v_active)
+                self.refresh_rate_spinbox.setValue(refresh_rate)
+                self.reduced_blanking_checkbox.setChecked(reduced_blanking)
+                
+                # 根据预设计算像素时钟
+                # 使用标准 CVT 算法计算像素时钟
+                temp_results = self.calculator.calculate(
+                    h_active=h_active,
+                    v_active=v_active,
+                    refresh_rate=refresh_rate,
+                    reduced_blanking=reduced_blanking
+                )
+                
+                if 'pixel_clock' in temp_results and not temp_results.get('error', False):
+                    self.pixel_clock_spinbox.setValue(temp_results['pixel_clock'])
+            
+            # 全部填充完成后只显式触发一次计算
+            self._on_calculate()
+    
+    @staticmethod
+    @contextmanager
+    def _updates_suspended(widget):
+        """
+        批量写入控件时挂起重绘和信号
+
+        进入时关闭控件重绘并屏蔽其信号，退出时（含异常路径）恢复，
+        使循环里的多次 setText 合并为一次重绘，且不逐项触发 Qt 信号。
+        """
+        widget.setUpdatesEnabled(False)
+        widget.blockSignals(True)
+        try:
+            yield
+        finally:
+            widget.blockSignals(False)
+            widget.setUpdatesEnabled(True)
+
+    def _update_results_table(self, results: dict):
+        """
+        更新结果表格显示
+        
+        将计算结果填充到表格中，格式化数值并添加单位。
+        
+        参数:
+            results: 包含所有时序参数的字典
+        """
+        # 填充表格（只重写文本发生变化的单元格）；
+        # 更新期间挂起表格重绘，多个 setText 合并为一次重绘
+        with self._updates_suspended(self.results_table):
+            # 上一次显示的是错误文本时，先把第一行前景色恢复默认
+            if self._error_row_active:
+                self._result_items[0].setForeground(self._default_foreground)
+                self._error_row_active = False
+
+            for i, (key, fmt) in enumerate(self.RESULT_FIELDS):
+                if key in results:
+                    formatted_value = fmt.format(results[key])
+
+                    if formatted_value != self._last_values[i]:
+                        self._result_items[i].setText(formatted_value)
+                        self._last_values[i] = formatted_value
+    
+    def _show_error(self, message: str):
+        """
+        显示错误消息
+        
+        在输出区域和状态栏显示错误信息，使用红色文本突出显示。
+        
+        参数:
+            message: 错误消息文本
+        """
+        # 在状态栏显示错误消息（红色）
+        self._status_bar.showMessage(f"错误: {message}", 5000)
+        self._status_bar.setStyleSheet(self._STYLE_ERROR)
+        
+        # 在输出表格的第一行显示错误消息，其余行清空；
+        # 批量写入期间挂起表格重绘，合并为一次重绘。
+        # 原地改写既有条目而非 setItem 换新对象，缓存的引用保持有效
+        with self._updates_suspended(self.results_table):
+            error_item = self._result_items[0]
+            error_item.setText(f"⚠ 错误: {message}")
+            error_item.setForeground(Qt.red)
+            self._error_row_active = True
+
+            # 清空其他行（对缓存列表切片迭代，行数跟随 PARAM_NAMES）
+            for item in self._result_items[1:]:
+                item.setText("")
+        
+        # 错误覆盖了数值列，重置缓存让下次成功计算重写所有单元格，
+        # 并失效输入缓存，改回原输入时也会重新计算覆盖错误显示
+        self._last_values = [None] * len(self._last_values)
+        self._last_inputs = None
+        
+        # 5 秒后恢复状态栏正常样式（复用常驻定时器）
+        self._error_reset_timer.start()
+    
+    def _reset_statusbar_style(self):
+        """恢复状态栏默认样式（错误红色显示超时后由定时器调用）"""
+        self._status_bar.setStyleSheet(self._STYLE_NORMAL)
+
+    def _copy_results(self):
+        """
+        复制结果到剪贴板
+        
+        将所有计算结果格式化为文本并复制到系统剪贴板。
+        格式：每行一个参数，格式为"参数名称: 数值 单位"
+        """
+        # 检查是否有计算结果（any 对缓存条目短路遍历）
+        if not any(item.text() for item in self._result_items):
+            self._status_bar.showMessage("没有可复制的内容", 3000)
+            return
+
+        # 构建复制文本并写入剪贴板（参数名列是静态的，用预渲染前缀
+        # 拼接；生成器直接喂给 join，省去中间列表及其逐项 append）
+        self._clipboard.setText("\n".join(
+            prefix + value
+            for prefix, item in zip(self._param_prefixes, self._result_items)
+            if (value := item.text())  # 只复制有值的行
+        ))
+        
+        # 显示确认消息
+        self._status_bar.showMessage("结果已复制到剪贴板", 3000)
+    
+    def _generate_rtl_code(self):
+        """
+        生成 RTL 代码
+        
+        根据当前的计算结果生成 Verilog RTL 代码和测试平台，
+        保存到 ./output 目录。
+        """
+        import os
+        from vesa_timing_rtl_template import generate_verilog_rtl, generate_testbench
+        
+        # 检查是否有计算结果（any 对缓存条目短路遍历）
+        if not any(item.text() for item in self._result_items):
+            self._status_bar.showMessage("请先计算时序参数", 3000)
+            return
+        
+        try:
+            # 收集当前的时序参数
+            timing_params = {}
+            
+            # 从输入框获取基本参数
+            timing_params['h_active'] = self.h_active_spinbox.value()
+            timing_params['v_active'] = self.v_active_spinbox.value()
+            
+            # 从结果表格提取参数
+            param_keys = [
+                'pixel_clock', 'h_total', 'h_blanking', 'h_front_porch',
+                'h_sync_pulse', 'h_back_porch', 'v_total', 'v_blanking',
+                'v_front_porch', 'v_sync_pulse', 'v_back_porch'
+            ]
+            
+            for i, key in enumerate(param_keys):
+                value_text = self._result_items[i].text()
+                if value_text:
+                    # 提取数值（去除单位）
+                    value_str = value_text.split()[0]
+                    if key == 'pixel_clock':
+                        timing_params[key] = float(value_str)
+                    else:
+                        timing_params[key] = int(value_str)
+            
+            # 获取刷新率
+            mode = self.mode_combobox.currentIndex()
+            if mode == 0:
+                timing_params['refresh_rate'] = self.refresh_rate_spinbox.value()
+            else:
+                # 反向计算模式，刷新率已经在结果中
+                timing_params['refresh_rate'] = self.refresh_rate_spinbox.value()
+            
+            # 创建输出目录
+            output_dir = "./output"
+            os.makedirs(output_dir, exist_ok=True)
+            
+            # 生成文件名
+            h_active = timing_params['h_active']
+            v_active = timing_params['v_active']
+            refresh_rate = timing_params['refresh_rate']
+            module_name = f"vesa_timing_{h_active}x{v_active}_{int(refresh_rate)}hz"
+            
+            # 生成 RTL 代码
+            rtl_code = generate_verilog_rtl(timing_params, module_name)
+            rtl_filename = os.path.join(output_dir, f"{module_name}.v")
+            
+            with open(rtl_filename, 'w', encoding='utf-8') as f:
+                f.write(rtl_code)
+            
+            # 生成测试平台
+            tb_code = generate_testbench(timing_params, module_name)
+            tb_filename = os.path.join(output_dir, f"tb_{module_name}.v")
+            
+            with open(tb_filename, 'w', encoding='utf-8') as f:
+                f.write(tb_code)
+            
+            # 显示成功消息
+            success_msg = f"RTL 代码已生成:\n{rtl_filename}\n{tb_filename}"
+            self._status_bar.showMessage(f"RTL 代码已生成到 {output_dir} 目录", 5000)
+            
+            # 弹出成功对话框
+            from PyQt5.QtWidgets import QMessageBox
+            msg_box = QMessageBox(self)
+            msg_box.setIcon(QMessageBox.Information)
+            msg_box.setWindowTitle("生成成功")
+            msg_box.setText("RTL 代码生成成功！")
+            msg_box.setInformativeText(success_msg)
+            msg_box.setStandardButtons(QMessageBox.Ok)
+            msg_box.exec_()
+            
+        except Exception as e:
+            error_message = f"生成 RTL 代码时发生错误: {str(e)}"
+            self._status_bar.showMessage(error_message, 5000)
+            self._status_bar.setStyleSheet(self._STYLE_ERROR)
+            self._error_reset_timer.start()
+
+
+if __name__ == "__main__":
+    """
+    应用程序入口点
+    
+    初始化 Qt 应用程序，创建并显示主窗口，启动事件循环。
+    """
+    # 创建 QApplication 实例
+    app = QApplication(sys.argv)
+
+    # 设置应用程序属性
+    app.setApplicationName(APP_NAME)
+    app.setOrganizationName(ORG_NAME)
+    
+    # 创建并显示主窗口
+    window = MainWindow()
+    window.show()
+    
+    # 启动事件循环
+    sys.exit(app.exec_())
@@ -0,0 +1,961 @@
+"""
+VESA 视频时序计算核心
+
+基于 VESA CVT (Coordinated Video Timing) 标准计算视频时序参数。
+纯 Python 实现，不依赖任何 GUI 库，可被命令行工具和测试直接导入。
+"""
+
+import functools
+import math
+from bisect import bisect_left
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Tuple
+
+
+@dataclass(slots=True, frozen=True)
+class TimingParameters:
+    """
+    时序参数数据模型
+
+    slots=True 省去每实例的 __dict__，属性访问走 C 层槽描述符；
+    frozen=True 使实例可哈希，可直接作为缓存键。
+    """
+    
+    # 输入参数
+    h_active: int
+    v_active: int
+    refresh_rate: float
+    reduced_blanking: bool
+    
+    # 输出参数
+    pixel_clock: float = 0.0
+    h_total: int = 0
+    h_blanking: int = 0
+    h_front_porch: int = 0
+    h_sync_pulse: int = 0
+    h_back_porch: int = 0
+    v_total: int = 0
+    v_blanking: int = 0
+    v_front_porch: int = 0
+    v_sync_pulse: int = 0
+    v_back_porch: int = 0
+    
+    def validate_input(self) -> Tuple[bool, str]:
+        """
+        验证输入参数有效性
+        
+        返回:
+            (is_valid, error_message): 验证结果和错误消息（如果有）
+        """
+        message = _validate_ranges(self.h_active, self.v_active,
+                                   self.refresh_rate)
+        if message is not None:
+            return False, message
+        return True, ""
+    
+    def to_dict(self) -> dict:
+        """
+        转换为字典格式
+
+        返回:
+            包含所有参数的字典（键序与字段定义一致）
+        """
+        return {name: getattr(self, name) for name in _TP_FIELDS}
+
+
+# 字段名在类定义时固化一次，to_dict 按此遍历而非重建字面量字典
+_TP_FIELDS = tuple(f.name for f in fields(TimingParameters))
+
+
+def _validate_ranges(h_active, v_active, refresh_rate=None):
+    """
+    输入范围验证的唯一实现
+
+    此前 TimingParameters.validate_input 和 VesaCalculator.calculate
+    各自维护一份相同的范围检查，这里收敛为一份。范围下界已隐含
+    "大于零"，旧的零/负值补充检查是死分支，一并去除。
+
+    参数:
+        refresh_rate: 为 None 时跳过刷新率检查（反向计算模式）
+
+    返回:
+        None 表示全部通过，否则为错误消息字符串
+    """
+    if not (640 <= h_active <= 7680):
+        return _ERR_H_RANGE.format(h_active)
+    if not (480 <= v_active <= 4320):
+        return _ERR_V_RANGE.format(v_active)
+    if refresh_rate is not None and not (24.0 <= refresh_rate <= 240.0):
+        return _ERR_RR_RANGE.format(refresh_rate)
+    return None
+
+
+# 错误消息模板：常量前缀只在模块加载时构建/驻留一次，
+# 失败路径用一次 format 填入当前值（成功路径完全不碰这些字符串）
+_ERR_H_RANGE = "水平分辨率必须在 640 到 7680 像素之间，当前值: {}"
+_ERR_V_RANGE = "垂直分辨率必须在 480 到 4320 行之间，当前值: {}"
+_ERR_RR_RANGE = "刷新率必须在 24 到 240 Hz 之间，当前值: {}"
+_ERR_PC_POSITIVE = "像素时钟必须大于零，当前值: {}"
+_ERR_CALC = "计算过程中发生错误: {}"
+
+# 消息不含动态字段的错误返回只读共享：每次失败复用同一对象，
+# 不再为每个返回分配新字典（MappingProxyType 防止调用方改写）
+_ERR_MODE_REQUIRED = MappingProxyType({
+    'error': True,
+    'message': '请提供刷新率或像素时钟参数'
+})
+
+
+def _error(message: str) -> dict:
+    """构造带动态消息的错误返回字典"""
+    return {'error': True, 'message': message}
+
+
+# 标准 CVT 水平消隐像素阶梯：分辨率上限（含）与对应消隐像素数
+_H_BLANK_THRESHOLDS = (1024, 1280, 1920)
+_H_BLANK_VALUES = (256, 320, 280, 288)
+
+
+def _h_blank_for(h_active_rounded: int) -> int:
+    """
+    按分辨率查找标准 CVT 模式的水平消隐像素数
+
+    取代散落在各计算方法中的 if/elif 阶梯，
+    消隐阶梯只维护这一份数据；bisect 在 C 层完成区间定位。
+    """
+    return _H_BLANK_VALUES[bisect_left(_H_BLANK_THRESHOLDS, h_active_rounded)]
+
+
+# Numba 是可选依赖：可用时对纯数值核心做 JIT 编译，
+# 不可用时退化为普通 Python 函数，行为完全一致
+try:
+    from numba import njit as _njit
+except ImportError:
+    def _njit(*args, **kwargs):
+        def _decorator(func):
+            return func
+        return _decorator
+
+
+@_njit(cache=True)
+def _both_params_core(h_active, v_active, refresh_rate, pixel_clock,
+                      reduced_blanking):
+    """
+    双参数模式的纯数值计算核心
+    
+    只包含标量整型/浮点运算，不碰字典和异常，
+    这样 Numba nopython 模式可以把它编译成原生代码；
+    cache=True 让编译结果在多次运行之间复用。
+    常量为字面量（与 VesaCalculator 类常量一致），保持函数自包含可编译。
+    
+    返回:
+        (h_total, h_blanking, h_front_porch, h_sync_pulse, h_back_porch,
+         v_total, v_blanking, v_front_porch, v_sync_pulse, v_back_porch)
+    """
+    cell_gran = 8
+    h_active_rounded = (h_active // cell_gran) * cell_gran
+    
+    # h_total * v_total = pixel_clock * 1e6 / refresh_rate。
+    # 旧实现用固定点迭代逼近 v_total 并以 abs(差值)<0.01 判收敛，
+    # 但 h_total 在进入循环前就已确定，v_total = round(const / h_total)
+    # 在第一次迭代后即不再变化——迭代体是幂等的，
+    # 因此这里直接一步闭式求解，无需容差常量和迭代上限
+    total_pixels_times_lines = (pixel_clock * 1000000.0) / refresh_rate
+    
+    if reduced_blanking:
+        # CVT-RB 模式：固定消隐参数
+        h_blanking = 160
+        h_sync_pulse = 32
+        h_back_porch = 80
+        h_front_porch = h_blanking - h_sync_pulse - h_back_porch
+        h_total = h_active_rounded + h_blanking
+        
+        v_sync_pulse = 8
+        v_front_porch = 3
+        
+        # v_total 与像素时钟呈线性关系，闭式求解
+        v_total = int(round(total_pixels_times_lines / h_total))
+        v_blanking = v_total - v_active
+        
+        min_v_blanking = v_front_porch + v_sync_pulse + 6
+        if v_blanking < min_v_blanking:
+            v_blanking = min_v_blanking
+        
+        v_back_porch = v_blanking - v_front_porch - v_sync_pulse
+    else:
+        # 标准 CVT 模式：消隐阶梯（与 _H_BLANK_THRESHOLDS/_H_BLANK_VALUES 一致）
+        if h_active_rounded <= 1024:
+            h_blank_pixels = 256
+        elif h_active_rounded <= 1280:
+            h_blank_pixels = 320
+        elif h_active_rounded <= 1920:
+            h_blank_pixels = 280
+        else:
+            h_blank_pixels = 288
+        
+        h_blanking = ((h_blank_pixels + cell_gran - 1) // cell_gran) * cell_gran
+        h_total = h_active_rounded + h_blanking
+        
+        # 8% 四舍五入的纯整数形式（见 _derive_h_timing_standard）
+        h_sync_pulse = ((h_blanking * 8 + 50) // 100 + cell_gran - 1) // cell_gran * cell_gran
+        
+        h_back_porch = ((h_blanking // 2) - (h_sync_pulse // 2)) // cell_gran * cell_gran
+        h_front_porch = h_blanking - h_sync_pulse - h_back_porch
+        
+        v_front_porch = 3
+        v_sync_pulse = 4
+        
+        v_total = int(round(total_pixels_times_lines / h_total))
+        v_blanking = v_total - v_active
+        
+        min_v_blanking = v_front_porch + v_sync_pulse + 1
+        if v_blanking < min_v_blanking:
+            v_blanking = min_v_blanking
+        
+        v_back_porch = v_blanking - v_front_porch - v_sync_pulse
+    
+    # 最终一致化
+    v_blanking = v_front_porch + v_sync_pulse + v_back_porch
+    v_total = v_active + v_blanking
+    
+    return (h_total, h_blanking, h_front_porch, h_sync_pulse, h_back_porch,
+            v_total, v_blanking, v_front_porch, v_sync_pulse, v_back_porch)
+
+
+@_njit(cache=True)
+def _rb_v_blanking(h_total, pixel_clock, v_front_porch, v_sync_pulse):
+    """
+    CVT-RB 反向计算的垂直消隐闭式求解（纯数值，可 JIT 编译）
+
+    旧实现用定点迭代逼近：每轮由 v_total 算刷新率、再算行周期、
+    再反推消隐行数。但行周期 h_period = 1e6/(rr*v_total) 中
+    rr = pc*1e6/(h_total*v_total)，v_total 约去后只剩
+    h_period = h_total/pixel_clock —— 迭代量根本不依赖迭代变量，
+    循环首轮即收敛，这里直接一步求出。常量为字面量
+    （与 VesaCalculator.RB_V_BLANK / RB_MIN_V_BPORCH 一致）。
+
+    返回:
+        v_blanking 行数
+    """
+    # 460/h_period = 460*pixel_clock/h_total；先乘后除保留最多有效位，
+    # 避免两次除法在整数边界上翻转 ceil
+    v_blanking_lines = int(math.ceil(460.0 * pixel_clock / h_total))
+    min_v_blanking = v_front_porch + v_sync_pulse + 6
+    return max(v_blanking_lines, min_v_blanking)
+
+
+@_njit(cache=True)
+def _std_v_back_porch(h_total, pixel_clock, v_sync_pulse):
+    """
+    标准 CVT 反向计算的垂直后廊闭式求解（纯数值，可 JIT 编译）
+
+    与 _rb_v_blanking 同理：550 微秒最小垂直同步+后廊时间
+    对应的行数只依赖行周期 h_total/pixel_clock，无需迭代。
+    常量为字面量（与 VesaCalculator.MIN_V_SYNC_BP 一致）。
+
+    返回:
+        v_back_porch 行数
+    """
+    # 550/h_period = 550*pixel_clock/h_total（先乘后除，理由同上）
+    min_v_sync_bp_lines = int(math.ceil(550.0 * pixel_clock / h_total))
+    return max(min_v_sync_bp_lines - v_sync_pulse, 1)
+
+
+class TimingResult:
+    """
+    计算结果的轻量容器
+    
+    使用 __slots__ 避免每个实例的 __dict__ 分配，
+    构造成本和内存占用都低于逐键插入的字典。
+    计算内部统一用本类传递结果，公开接口在边界处转换为字典。
+    """
+    
+    __slots__ = ('pixel_clock', 'refresh_rate', 'h_total', 'h_blanking',
+                 'h_front_porch', 'h_sync_pulse', 'h_back_porch',
+                 'v_total', 'v_blanking', 'v_front_porch', 'v_sync_pulse',
+                 'v_back_porch')
+    
+    def __init__(self, pixel_clock, h_total, h_blanking, h_front_porch,
+                 h_sync_pulse, h_back_porch, v_total, v_blanking,
+                 v_front_porch, v_sync_pulse, v_back_porch,
+                 refresh_rate=None):
+        self.pixel_clock = pixel_clock
+        self.refresh_rate = refresh_rate
+        self.h_total = h_total
+        self.h_blanking = h_blanking
+        self.h_front_porch = h_front_porch
+        self.h_sync_pulse = h_sync_pulse
+        self.h_back_porch = h_back_porch
+        self.v_total = v_total
+        self.v_blanking = v_blanking
+        self.v_front_porch = v_front_porch
+        self.v_sync_pulse = v_sync_pulse
+        self.v_back_porch = v_back_porch
+    
+    def items(self) -> tuple:
+        """
+        按公开字典的键序返回 (key, value) 元组
+        
+        refresh_rate 仅在反向/双参数模式下设置，
+        为保持返回字典形状不变，未设置时不包含该键。
+        """
+        pairs = [('pixel_clock', self.pixel_clock)]
+        if self.refresh_rate is not None:
+            pairs.append(('refresh_rate', self.refresh_rate))
+        pairs.extend((
+            ('h_total', self.h_total),
+            ('h_blanking', self.h_blanking),
+            ('h_front_porch', self.h_front_porch),
+            ('h_sync_pulse', self.h_sync_pulse),
+            ('h_back_porch', self.h_back_porch),
+            ('v_total', self.v_total),
+            ('v_blanking', self.v_blanking),
+            ('v_front_porch', self.v_front_porch),
+            ('v_sync_pulse', self.v_sync_pulse),
+            ('v_back_porch', self.v_back_porch),
+        ))
+        return tuple(pairs)
+
+
+class VesaCalculator:
+    """
+    VESA CVT 标准时序计算器
+    
+    实现 VESA Coordinated Video Timing (CVT) 标准算法，
+    支持标准 CVT 模式和 CVT Reduced Blanking (CVT-RB) 模式。
+    """
+    
+    # 标准 CVT 模式常量
+    H_SYNC_PERCENT = 8.0  # 水平同步脉冲占消隐区的百分比
+    MIN_V_SYNC_BP = 550.0  # 最小垂直同步+后廊时间 (微秒)
+    MIN_V_PORCH = 3  # 最小垂直前廊行数
+    CELL_GRAN = 8  # 像素粒度（水平像素必须是 8 的倍数）
+    
+    # CVT-RB 模式常量
+    RB_H_BLANK = 160  # 固定水平消隐像素
+    RB_V_BLANK = 460.0  # 固定垂直消隐时间 (微秒)
+    RB_H_SYNC = 32  # 固定水平同步脉冲宽度
+    RB_V_SYNC = 8  # 固定垂直同步脉冲行数
+    RB_MIN_V_BPORCH = 6  # 最小垂直后廊行数
+    
+    def calculate(self, h_active: int, v_active: int,
+                  refresh_rate: float = None, pixel_clock: float = None,
+                  reduced_blanking: bool = False) -> dict:
+        """
+        计算 CVT 时序参数
+        
+        支持三种计算模式：
+        1. 正向计算：提供 refresh_rate，计算 pixel_clock 和其他参数
+        2. 反向计算：提供 pixel_clock，计算 refresh_rate 和其他参数
+        3. 双参数计算：同时提供 refresh_rate 和 pixel_clock，计算时序参数
+        
+        参数:
+            h_active: 水平有效像素 (640-7680)
+            v_active: 垂直有效行数 (480-4320)
+            refresh_rate: 刷新率 Hz (24-240)，模式1和3时必需
+            pixel_clock: 像素时钟 MHz，模式2和3时必需
+            reduced_blanking: 是否使用 CVT-RB 模式
+            
+        返回:
+            包含所有时序参数的字典，如果输入无效则返回错误信息
+        """
+        # 验证基本参数（与 TimingParameters.validate_input 共用一份实现）
+        message = _validate_ranges(h_active, v_active, refresh_rate)
+        if message is not None:
+            return _error(message)
+        
+        # 检查计算模式
+        if refresh_rate is None and pixel_clock is None:
+            return _ERR_MODE_REQUIRED
+        
+        if pixel_clock is not None and pixel_clock <= 0:
+            return _error(_ERR_PC_POSITIVE.format(pixel_clock))
+        
+        # 验证通过后统一走缓存计算：输入相同的配置直接命中缓存，
+        # 跳过整个 CVT 计算；每次调用重建新字典，避免调用方修改缓存内容。
+        # 范围验证已在上方完成，内部算术唯一可能的异常是除零
+        try:
+            return dict(_calc_cached(h_active, v_active, refresh_rate,
+                                     pixel_clock, reduced_blanking))
+        except ZeroDivisionError as e:
+            return _error(_ERR_CALC.format(e))
+    
+    @staticmethod
+    def calculate_batch(h_active, v_active, refresh_rate,
+                        reduced_blanking=False, pixel_clock=None) -> dict:
+        """
+        批量计算 CVT 时序参数（委托给模块级向量化实现）
+        
+        分辨率/刷新率扫描类工作负载请走本入口，
+        参数与返回值见模块级 calculate_batch。
+        """
+        return calculate_batch(h_active, v_active, refresh_rate,
+                               reduced_blanking=reduced_blanking,
+                               pixel_clock=pixel_clock)
+    
+    def _derive_h_timing_standard(self, h_active_rounded: int) -> tuple:
+        """
+        推导标准 CVT 模式的水平时序
+        
+        此前同样的消隐/同步/前后廊推导在三个计算方法里各有一份副本，
+        这里收敛为唯一实现（委托给模块级缓存函数）。
+        
+        参数:
+            h_active_rounded: 已对齐到 CELL_GRAN 的水平有效像素
+            
+        返回:
+            (h_total, h_blanking, h_front_porch, h_sync_pulse, h_back_porch)
+        """
+        return _std_h_timings(h_active_rounded)
+    
+    def _derive_h_timing_rb(self, h_active_rounded: int) -> tuple:
+        """
+        推导 CVT-RB 模式的水平时序（固定消隐参数）
+        
+        参数:
+            h_active_rounded: 已对齐到 CELL_GRAN 的水平有效像素
+            
+        返回:
+            (h_total, h_blanking, h_front_porch, h_sync_pulse, h_back_porch)
+        """
+        h_blanking = self.RB_H_BLANK  # 固定 160 像素
+        h_sync_pulse = self.RB_H_SYNC  # 固定 32 像素
+        
+        # 后廊 = 80 像素，前廊 = 48 像素（标准分配）
+        h_back_porch = 80
+        h_front_porch = h_blanking - h_sync_pulse - h_back_porch
+        h_total = h_active_rounded + h_blanking
+        
+        return h_total, h_blanking, h_front_porch, h_sync_pulse, h_back_porch
+    
+    def _calculate_standard_cvt(self, h_active: int, v_active: int, 
+                                refresh_rate: float) -> TimingResult:
+        """
+        实现标准 CVT 算法
+        
+        基于 VESA CVT 1.2 标准规范计算时序参数。
+        
+        算法步骤:
+        1. 将水平分辨率调整为 CELL_GRAN 的倍数
+        2. 计算垂直时序参数（前廊、同步、后廊）
+        3. 计算理想消隐时间和水平周期
+        4. 计算水平时序参数
+        5. 计算像素时钟频率
+        
+        参数:
+            h_active: 水平有效像素
+            v_active: 垂直有效行数
+            refresh_rate: 刷新率 Hz
+            
+        返回:
+            包含所有 11 个时序参数的字典
+        """
+        # 步骤 1: 确保水平分辨率是 CELL_GRAN 的倍数
+        # VESA CVT 标准要求水平像素必须是 8 的倍数
+        h_active_rounded = h_active & _GRAN_MASK
+        
+        # 步骤 2: 计算垂直时序参数
+        # 垂直前廊固定为最小值
+        v_front_porch = self.MIN_V_PORCH
+        
+        # 垂直同步脉冲固定为 4 行（CVT 标准）
+        v_sync_pulse = 4
+        
+        # 计算垂直后廊
+        # 根据 CVT 标准，垂直同步+后廊的最小时间为 MIN_V_SYNC_BP 微秒
+        # 首先估算行时间（假设典型的水平频率）
+        # 使用迭代方法：先估算，然后根据实际计算调整
+        
+        # 估算垂直场频率（考虑消隐）
+        v_sync_bp_lines = 10  # 初始估算值
+        estimated_v_total = v_active + v_front_porch + v_sync_pulse + v_sync_bp_lines
+        
+        # 估算水平频率 (Hz)
+        h_freq_est = refresh_rate * estimated_v_total
+
+        # 根据最小垂直同步+后廊时间计算所需行数
+        # 550/h_period = 550*h_freq*1e-6：乘法融合掉行周期的中间除法
+        min_v_sync_bp_lines = math.ceil(self.MIN_V_SYNC_BP * h_freq_est * 1e-6)
+        
+        # 垂直后廊 = 最小同步+后廊行数 - 同步脉冲行数
+        v_back_porch = max(min_v_sync_bp_lines - v_sync_pulse, 1)
+        
+        # 计算垂直消隐和总行数
+        v_blanking = v_front_porch + v_sync_pulse + v_back_porch
+        v_total = v_active + v_blanking
+        
+        # 步骤 3: 计算理想消隐时间和水平周期
+        # 计算实际垂直场频率
+        v_field_rate_est = refresh_rate
+        
+        # 计算水平频率 (Hz)
+        h_freq = v_field_rate_est * v_total
+        
+        # 计算理想水平周期 (微秒)
+        ideal_h_period = 1000000.0 / h_freq
+        
+        # 步骤 4: 计算水平时序参数（统一的推导辅助方法）
+        (h_total, h_blanking, h_front_porch,
+         h_sync_pulse, h_back_porch) = self._derive_h_timing_standard(h_active_rounded)
+        
+        # 步骤 5: 计算像素时钟频率
+        # 像素时钟 (MHz) = 水平总像素 * 垂直总行数 * 刷新率 / 1,000,000
+        pixel_clock = (h_total * v_total * refresh_rate) / 1000000.0
+        
+        # 返回所有计算结果
+        return TimingResult(
+            pixel_clock=round(pixel_clock, 2),
+            h_total=h_total,
+            h_blanking=h_blanking,
+            h_front_porch=h_front_porch,
+            h_sync_pulse=h_sync_pulse,
+            h_back_porch=h_back_porch,
+            v_total=v_total,
+            v_blanking=v_blanking,
+            v_front_porch=v_front_porch,
+            v_sync_pulse=v_sync_pulse,
+            v_back_porch=v_back_porch,
+        )
+    
+    def _calculate_reduced_blanking(self, h_active: int, v_active: int, 
+                                    refresh_rate: float) -> TimingResult:
+        """
+        实现 CVT Reduced Blanking (CVT-RB) 算法
+        
+        CVT-RB 模式使用固定的消隐时间来减少带宽需求，
+        适用于数字显示接口（如 DVI、HDMI、DisplayPort）。
+        
+        算法特点:
+        - 固定的水平消隐像素 (160 pixels)
+        - 固定的垂直消隐时间 (460 微秒)
+        - 固定的同步脉冲宽度
+        - 更低的像素时钟频率
+        
+        参数:
+            h_active: 水平有效像素
+            v_active: 垂直有效行数
+            refresh_rate: 刷新率 Hz
+            
+        返回:
+            包含所有 11 个时序参数的字典
+        """
+        # 常见工作点（预设分辨率 × VESA 标准 RB 刷新率）在模块加载时
+        # 已算好，命中时一次字典查找直接返回
+        cached = _RB_PRECOMPUTED.get((h_active, v_active, refresh_rate))
+        if cached is not None:
+            return cached
+        
+        # 步骤 1: 确保水平分辨率是 CELL_GRAN 的倍数
+        h_active_rounded = h_active & _GRAN_MASK
+        
+        # 步骤 2: 使用固定的水平消隐参数（CVT-RB 标准）
+        (h_total, h_blanking, h_front_porch,
+         h_sync_pulse, h_back_porch) = self._derive_h_timing_rb(h_active_rounded)
+        
+        # 步骤 3: 计算垂直时序参数
+        # 垂直同步脉冲固定为 8 行（CVT-RB 标准）
+        v_sync_pulse = self.RB_V_SYNC
+        
+        # 垂直前廊固定为最小值
+        v_front_porch = self.MIN_V_PORCH
+        
+        # 计算垂直后廊
+        # 首先估算水平频率和行时间
+        # 使用迭代方法计算
+        
+        # 初始估算：假设垂直后廊为最小值
+        v_back_porch = self.RB_MIN_V_BPORCH
+        v_blanking = v_front_porch + v_sync_pulse + v_back_porch
+        v_total_est = v_active + v_blanking
+        
+        # 计算水平频率 (Hz)
+        h_freq = refresh_rate * v_total_est
+
+        # 根据固定的垂直消隐时间 (460 微秒) 计算所需行数
+        # 460/h_period = 460*h_freq*1e-6：乘法融合掉行周期的中间除法
+        v_blanking_lines = math.ceil(self.RB_V_BLANK * h_freq * 1e-6)
+        
+        # 确保垂直消隐行数至少包含前廊和同步脉冲
+        min_v_blanking = v_front_porch + v_sync_pulse + self.RB_MIN_V_BPORCH
+        v_blanking = max(v_blanking_lines, min_v_blanking)
+        
+        # 计算垂直后廊（剩余的消隐行数）
+        v_back_porch = v_blanking - v_front_porch - v_sync_pulse
+        
+        # 计算垂直总行数
+        v_total = v_active + v_blanking
+        
+        # 步骤 4: 计算像素时钟频率
+        # 像素时钟 (MHz) = 水平总像素 * 垂直总行数 * 刷新率 / 1,000,000
+        pixel_clock = (h_total * v_total * refresh_rate) / 1000000.0
+        
+        # 返回所有计算结果
+        return TimingResult(
+            pixel_clock=round(pixel_clock, 2),
+            h_total=h_total,
+            h_blanking=h_blanking,
+            h_front_porch=h_front_porch,
+            h_sync_pulse=h_sync_pulse,
+            h_back_porch=h_back_porch,
+            v_total=v_total,
+            v_blanking=v_blanking,
+            v_front_porch=v_front_porch,
+            v_sync_pulse=v_sync_pulse,
+            v_back_porch=v_back_porch,
+        )
+    
+    def _calculate_from_pixel_clock(self, h_active: int, v_active: int,
+                                    pixel_clock: float, reduced_blanking: bool = False) -> TimingResult:
+        """
+        从像素时钟反向计算时序参数
+        
+        根据给定的像素时钟频率，计算对应的刷新率和其他时序参数。
+        使用 CVT 标准的固定消隐参数。
+        
+        参数:
+            h_active: 水平有效像素
+            v_active: 垂直有效行数
+            pixel_clock: 像素时钟频率 (MHz)
+            reduced_blanking: 是否使用 CVT-RB 模式
+            
+        返回:
+            包含所有 11 个时序参数和计算出的刷新率的字典
+        """
+        # 步骤 1: 确保水平分辨率是 CELL_GRAN 的倍数
+        h_active_rounded = h_active & _GRAN_MASK
+        
+        if reduced_blanking:
+            # CVT-RB 模式：使用固定的消隐参数
+            (h_total, h_blanking, h_front_porch,
+             h_sync_pulse, h_back_porch) = self._derive_h_timing_rb(h_active_rounded)
+            
+            # 垂直时序参数
+            v_sync_pulse = self.RB_V_SYNC
+            v_front_porch = self.MIN_V_PORCH
+            
+            # 460 微秒垂直消隐时间对应的行数（闭式求解，无需迭代）
+            v_blanking = _rb_v_blanking(h_total, pixel_clock,
+                                        v_front_porch, v_sync_pulse)
+            v_back_porch = v_blanking - v_front_porch - v_sync_pulse
+            
+        else:
+            # 标准 CVT 模式：统一的水平时序推导
+            (h_total, h_blanking, h_front_porch,
+             h_sync_pulse, h_back_porch) = self._derive_h_timing_standard(h_active_rounded)
+            
+            # 垂直时序参数
+            v_front_porch = self.MIN_V_PORCH
+            v_sync_pulse = 4
+            
+            # 550 微秒最小垂直同步+后廊时间对应的行数（闭式求解，无需迭代）
+            v_back_porch = _std_v_back_porch(h_total, pixel_clock, v_sync_pulse)
+        
+        # 最终计算
+        v_blanking = v_front_porch + v_sync_pulse + v_back_porch
+        v_total = v_active + v_blanking
+        refresh_rate = (pixel_clock * 1000000.0) / (h_total * v_total)
+        
+        # 返回所有计算结果
+        return TimingResult(
+            pixel_clock=round(pixel_clock, 2),
+            refresh_rate=round(refresh_rate, 2),  # 添加计算出的刷新率
+            h_total=h_total,
+            h_blanking=h_blanking,
+            h_front_porch=h_front_porch,
+            h_sync_pulse=h_sync_pulse,
+            h_back_porch=h_back_porch,
+            v_total=v_total,
+            v_blanking=v_blanking,
+            v_front_porch=v_front_porch,
+            v_sync_pulse=v_sync_pulse,
+            v_back_porch=v_back_porch,
+        )
+
+
+
+    def _calculate_with_both_params(self, h_active: int, v_active: int,
+                                   refresh_rate: float, pixel_clock: float,
+                                   reduced_blanking: bool = False) -> TimingResult:
+        """
+        同时使用像素时钟和刷新率计算时序参数
+        
+        这种模式下，用户同时指定像素时钟和刷新率，
+        系统会计算相应的时序参数，确保两者兼容。
+        纯数值部分委托给可 JIT 编译的 _both_params_core，
+        本方法只负责参数打包和结果封装。
+        
+        参数:
+            h_active: 水平有效像素
+            v_active: 垂直有效行数
+            refresh_rate: 刷新率 Hz
+            pixel_clock: 像素时钟频率 MHz
+            reduced_blanking: 是否使用 CVT-RB 模式
+            
+        返回:
+            包含所有时序参数的 TimingResult
+        """
+        (h_total, h_blanking, h_front_porch, h_sync_pulse, h_back_porch,
+         v_total, v_blanking, v_front_porch, v_sync_pulse,
+         v_back_porch) = _both_params_core(
+            h_active, v_active, refresh_rate, pixel_clock, reduced_blanking)
+        
+        # 返回所有计算结果
+        return TimingResult(
+            pixel_clock=round(pixel_clock, 2),  # 使用输入的像素时钟
+            refresh_rate=round(refresh_rate, 2),  # 使用输入的刷新率
+            h_total=h_total,
+            h_blanking=h_blanking,
+            h_front_porch=h_front_porch,
+            h_sync_pulse=h_sync_pulse,
+            h_back_porch=h_back_porch,
+            v_total=v_total,
+            v_blanking=v_blanking,
+            v_front_porch=v_front_porch,
+            v_sync_pulse=v_sync_pulse,
+            v_back_porch=v_back_porch,
+        )
+
+
+# CELL_GRAN 是 2 的幂，像素粒度对齐可用位掩码完成：
+# x & _GRAN_MASK 向下对齐，(x + _GRAN_MINUS1) & _GRAN_MASK 向上对齐，
+# 比整除+乘法少一次算术指令且无除法的异常检查开销
+assert VesaCalculator.CELL_GRAN & (VesaCalculator.CELL_GRAN - 1) == 0
+_GRAN_MINUS1 = VesaCalculator.CELL_GRAN - 1
+_GRAN_MASK = ~_GRAN_MINUS1
+
+
+@functools.lru_cache(maxsize=1024)
+def _std_h_timings(h_active_rounded: int) -> tuple:
+    """
+    标准 CVT 模式水平时序的唯一实现（按对齐后分辨率缓存）
+    
+    水平时序只依赖 h_active_rounded，合法取值不足一千个，
+    lru_cache 让重复分辨率的推导退化为一次字典查找。
+    
+    返回:
+        (h_total, h_blanking, h_front_porch, h_sync_pulse, h_back_porch)
+    """
+    # 消隐像素按分辨率从查找表取得，并对齐到 CELL_GRAN
+    h_blank_pixels = _h_blank_for(h_active_rounded)
+    h_blanking = (h_blank_pixels + _GRAN_MINUS1) & _GRAN_MASK
+    h_total = h_active_rounded + h_blanking
+    
+    # 水平同步脉冲宽度（占消隐区的 8%），对齐到 CELL_GRAN。
+    # H_SYNC_PERCENT=8 和 CELL_GRAN=8 都是 VESA CVT 规范常量，
+    # 四舍五入可以写成纯整数算术，省去 float 往返和 round() 调用；
+    # 对消隐阶梯的所有取值结果与浮点路径逐位一致
+    h_sync_pulse = ((h_blanking * 8 + 50) // 100 + _GRAN_MINUS1) & _GRAN_MASK
+    
+    # 水平后廊（消隐区的一半减去同步脉冲的一半），前廊取剩余
+    h_back_porch = ((h_blanking // 2) - (h_sync_pulse // 2)) & _GRAN_MASK
+    h_front_porch = h_blanking - h_sync_pulse - h_back_porch
+    
+    return h_total, h_blanking, h_front_porch, h_sync_pulse, h_back_porch
+
+
+# CVT-RB 常见工作点预计算表：构建期间为空字典，
+# _calculate_reduced_blanking 内的查表自然落空走完整计算
+_RB_PRECOMPUTED = {}
+
+
+# 模块级共享实例：计算方法均为无状态纯函数，可被缓存包装函数复用
+_CALC_IMPL = VesaCalculator()
+
+
+# 模块加载时为预设分辨率 × VESA 标准 RB 刷新率填表，
+# 典型用户路径（预设点击、常见刷新率）完全绕开 ceil/除法代码
+_RB_COMMON_RESOLUTIONS = ((1280, 720), (1920, 1080), (2560, 1440),
+                          (3840, 2160), (1920, 1200))
+_RB_COMMON_RATES = (50.0, 60.0, 75.0, 120.0)
+for _h, _v in _RB_COMMON_RESOLUTIONS:
+    for _r in _RB_COMMON_RATES:
+        _RB_PRECOMPUTED[(_h, _v, _r)] = _CALC_IMPL._calculate_reduced_blanking(
+            _h, _v, _r)
+del _h, _v, _r
+
+
+@functools.lru_cache(maxsize=256)
+def _calc_cached(h_active: int, v_active: int, refresh_rate: float,
+                 pixel_clock: float, reduced_blanking: bool) -> tuple:
+    """
+    按输入参数缓存的计算调度函数
+    
+    输入是少量 int/float/bool，输出是确定性的，因此整个 CVT 计算
+    可以按 (h_active, v_active, refresh_rate, pixel_clock, reduced_blanking)
+    记忆化。GUI 实时计算中用户反复切换相同配置时直接命中缓存。
+    参数验证（范围检查）保留在 VesaCalculator.calculate 中，不进入缓存。
+    
+    返回:
+        计算结果的 (key, value) 元组（冻结形式，可安全缓存）
+    """
+    if refresh_rate is not None and pixel_clock is not None:
+        result = _CALC_IMPL._calculate_with_both_params(
+            h_active, v_active, refresh_rate, pixel_clock, reduced_blanking)
+    elif refresh_rate is not None:
+        if reduced_blanking:
+            result = _CALC_IMPL._calculate_reduced_blanking(h_active, v_active, refresh_rate)
+        else:
+            result = _CALC_IMPL._calculate_standard_cvt(h_active, v_active, refresh_rate)
+    else:
+        result = _CALC_IMPL._calculate_from_pixel_clock(
+            h_active, v_active, pixel_clock, reduced_blanking)
+    return result.items()
+
+
+def calculate_batch(h_active, v_active, refresh_rate, reduced_blanking=False,
+                    pixel_clock=None) -> dict:
+    """
+    批量计算 CVT 时序参数（NumPy 向量化路径）
+    
+    扫描类工作负载（如遍历候选分辨率寻找整数 v_total）逐元组调用
+    calculate() 时，解释器循环开销远大于算术本身。本函数把整个
+    CVT 公式一次性作用在数组输入上，循环开销收敛为一趟 C 级向量运算。
+    
+    参数:
+        h_active: 水平有效像素，标量或数组 (640-7680)
+        v_active: 垂直有效行数，标量或数组 (480-4320)
+        refresh_rate: 刷新率 Hz，标量或数组 (24-240)
+        reduced_blanking: 是否使用 CVT-RB 模式，标量或布尔数组
+        pixel_clock: 像素时钟 MHz，标量或数组；提供时按双参数模式
+            闭式求解 v_total（与 _calculate_with_both_params 一致）
+        
+    返回:
+        与 calculate() 键名一致、值为 numpy 数组的字典；
+        输入超出范围时返回错误信息字典
+    """
+    # NumPy 是可选依赖：仅批量路径需要，延迟导入保持核心模块轻量
+    import numpy as np
+
+    def _round2(arr):
+        # np.round 在半分位边界的舍入可能与标量路径的内建 round
+        # 差 0.01（如 2712x600@75Hz），逐元素调用 round 保证
+        # 批量与标量结果逐位一致
+        return np.array([round(x, 2) for x in arr.tolist()],
+                        dtype=np.float64)
+
+    h = np.asarray(h_active, dtype=np.int64)
+    v = np.asarray(v_active, dtype=np.int64)
+    rr = np.asarray(refresh_rate, dtype=np.float64)
+    rb = np.asarray(reduced_blanking, dtype=bool)
+    h, v, rr, rb = np.broadcast_arrays(h, v, rr, rb)
+    
+    # 验证基本参数（整批一次检查）
+    if np.any((h < 640) | (h > 7680)):
+        return {
+            'error': True,
+            'message': '水平分辨率必须在 640 到 7680 像素之间'
+        }
+    
+    if np.any((v < 480) | (v > 4320)):
+        return {
+            'error': True,
+            'message': '垂直分辨率必须在 480 到 4320 行之间'
+        }
+    
+    if np.any((rr < 24.0) | (rr > 240.0)):
+        return {
+            'error': True,
+            'message': '刷新率必须在 24 到 240 Hz 之间'
+        }
+    
+    if pixel_clock is not None:
+        pc = np.broadcast_to(np.asarray(pixel_clock, dtype=np.float64),
+                             rr.shape)
+        if np.any(pc <= 0):
+            return {
+                'error': True,
+                'message': '像素时钟必须大于零'
+            }
+    
+    cell_gran = VesaCalculator.CELL_GRAN
+    h_rounded = (h // cell_gran) * cell_gran
+    
+    # ---- 标准 CVT 分支（与 _calculate_standard_cvt 逐步对应）----
+    v_front_std = VesaCalculator.MIN_V_PORCH
+    v_sync_std = 4
+    
+    est_v_total = v + v_front_std + v_sync_std + 10
+    h_period_est = 1000.0 / (rr * est_v_total / 1000.0)
+    min_v_sync_bp_lines = np.ceil(
+        VesaCalculator.MIN_V_SYNC_BP / h_period_est).astype(np.int64)
+    v_back_std = np.maximum(min_v_sync_bp_lines - v_sync_std, 1)
+
+    # 消隐阶梯用 np.where 展开（与 _H_BLANK_THRESHOLDS/_H_BLANK_VALUES 一致）
+    h_blank_pixels = np.where(
+        h_rounded <= 1024, 256,
+        np.where(h_rounded <= 1280, 320,
+                 np.where(h_rounded <= 1920, 280, 288)))
+    h_blank_std = ((h_blank_pixels + cell_gran - 1) // cell_gran) * cell_gran
+    
+    h_sync_std = np.rint(
+        h_blank_std * VesaCalculator.H_SYNC_PERCENT / 100.0).astype(np.int64)
+    h_sync_std = ((h_sync_std + cell_gran - 1) // cell_gran) * cell_gran
+    h_back_std = (((h_blank_std // 2) - (h_sync_std // 2)) // cell_gran) * cell_gran
+
+    # ---- CVT-RB 分支（与 _calculate_reduced_blanking 逐步对应）----
+    v_sync_rb = VesaCalculator.RB_V_SYNC
+    v_front_rb = VesaCalculator.MIN_V_PORCH
+    min_v_blank_rb = v_front_rb + v_sync_rb + VesaCalculator.RB_MIN_V_BPORCH
+    
+    v_total_est = v + min_v_blank_rb
+    h_period_rb = 1000000.0 / (rr * v_total_est)
+    v_blank_lines = np.ceil(VesaCalculator.RB_V_BLANK / h_period_rb).astype(np.int64)
+    v_blank_rb = np.maximum(v_blank_lines, min_v_blank_rb)
+    v_back_rb = v_blank_rb - v_front_rb - v_sync_rb
+    
+    # ---- 按模式掩码选择分支结果 ----
+    h_blanking = np.where(rb, VesaCalculator.RB_H_BLANK, h_blank_std)
+    h_sync_pulse = np.where(rb, VesaCalculator.RB_H_SYNC, h_sync_std)
+    h_back_porch = np.where(rb, 80, h_back_std)
+    h_front_porch = h_blanking - h_sync_pulse - h_back_porch
+    h_total = h_rounded + h_blanking
+    
+    v_front_porch = np.where(rb, v_front_rb, v_front_std)
+    v_sync_pulse = np.where(rb, v_sync_rb, v_sync_std)
+    v_back_porch = np.where(rb, v_back_rb, v_back_std)
+    v_blanking = v_front_porch + v_sync_pulse + v_back_porch
+    v_total = v + v_blanking
+    
+    if pixel_clock is not None:
+        # 双参数模式：v_total 由像素时钟/刷新率闭式求解并取整，
+        # 再按模式的最小垂直消隐约束截断
+        v_total = np.rint(pc * 1000000.0 / rr / h_total).astype(np.int64)
+        v_blanking = v_total - v
+        min_v_blanking = np.where(
+            rb, v_front_rb + v_sync_rb + VesaCalculator.RB_MIN_V_BPORCH,
+            v_front_std + v_sync_std + 1)
+        v_blanking = np.maximum(v_blanking, min_v_blanking)
+        v_back_porch = v_blanking - v_front_porch - v_sync_pulse
+        v_total = v + v_blanking
+        
+        return {
+            'pixel_clock': _round2(pc),
+            'refresh_rate': _round2(rr),
+            'h_total': h_total,
+            'h_blanking': h_blanking,
+            'h_front_porch': h_front_porch,
+            'h_sync_pulse': h_sync_pulse,
+            'h_back_porch': h_back_porch,
+            'v_total': v_total,
+            'v_blanking': v_blanking,
+            'v_front_porch': v_front_porch,
+            'v_sync_pulse': v_sync_pulse,
+            'v_back_porch': v_back_porch,
+        }
+    
+    pixel_clock = _round2(h_total * v_total * rr / 1000000.0)
+    
+    return {
+        'pixel_clock': pixel_clock,
+        'h_total': h_total,
+        'h_blanking': h_blanking,
+        'h_front_porch': h_front_porch,
+        'h_sync_pulse': h_sync_pulse,
+        'h_back_porch': h_back_porch,
+        'v_total': v_total,
+        'v_blanking': v_blanking,
+        'v_front_porch': v_front_porch,
+        'v_sync_pulse': v_sync_pulse,
+        'v_back_porch': v_back_porch,
+    }
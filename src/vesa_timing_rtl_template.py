@@ -1,360 +1,754 @@
-"""
-VESA 时序 RTL 代码生成模板
-
-根据计算出的时序参数生成 Verilog RTL 代码
-"""
-
-from datetime import datetime
-
-
-def generate_verilog_rtl(timing_params: dict, module_name: str = "vesa_timing_gen") -> str:
-    """
-    生成 Verilog RTL 代码
-    
-    参数:
-        timing_params: 时序参数字典，包含所有计算结果
-        module_name: 模块名称
-        
-    返回:
-        生成的 Verilog 代码字符串
-    """
-    
-    # 提取参数
-    h_active = timing_params.get('h_active', 1920)
-    v_active = timing_params.get('v_active', 1080)
-    pixel_clock = timing_params.get('pixel_clock', 148.5)
-    refresh_rate = timing_params.get('refresh_rate', 60.0)
-    
-    h_total = timing_params.get('h_total', 2200)
-    h_front_porch = timing_params.get('h_front_porch', 88)
-    h_sync_pulse = timing_params.get('h_sync_pulse', 44)
-    h_back_porch = timing_params.get('h_back_porch', 148)
-    
-    v_total = timing_params.get('v_total', 1125)
-    v_front_porch = timing_params.get('v_front_porch', 4)
-    v_sync_pulse = timing_params.get('v_sync_pulse', 5)
-    v_back_porch = timing_params.get('v_back_porch', 36)
-    
-    # 计算同步信号的起始和结束位置
-    h_sync_start = h_active + h_front_porch
-    h_sync_end = h_sync_start + h_sync_pulse
-    
-    v_sync_start = v_active + v_front_porch
-    v_sync_end = v_sync_start + v_sync_pulse
-    
-    # 计算计数器位宽
-    h_counter_width = (h_total - 1).bit_length()
-    v_counter_width = (v_total - 1).bit_length()
-    
-    # 生成时间戳
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    # 生成 Verilog 代码
-    verilog_code = f"""//==============================================================================
-// VESA Timing Generator
-// 
-// 自动生成时间: {timestamp}
-// 生成工具: VESA 视频时序计算器
-//
-// 时序参数:
-//   分辨率: {h_active}x{v_active}
-//   刷新率: {refresh_rate:.2f} Hz
-//   像素时钟: {pixel_clock:.2f} MHz
-//
-// 水平时序:
-//   H_ACTIVE      = {h_active}
-//   H_FRONT_PORCH = {h_front_porch}
-//   H_SYNC_PULSE  = {h_sync_pulse}
-//   H_BACK_PORCH  = {h_back_porch}
-//   H_TOTAL       = {h_total}
-//
-// 垂直时序:
-//   V_ACTIVE      = {v_active}
-//   V_FRONT_PORCH = {v_front_porch}
-//   V_SYNC_PULSE  = {v_sync_pulse}
-//   V_BACK_PORCH  = {v_back_porch}
-//   V_TOTAL       = {v_total}
-//==============================================================================
-
-module {module_name} (
-    input  wire        clk,           // 像素时钟 ({pixel_clock:.2f} MHz)
-    input  wire        rst_n,         // 异步复位，低电平有效
-    
-    output reg         hsync,         // 水平同步信号
-    output reg         vsync,         // 垂直同步信号
-    output reg         de,            // 数据使能信号
-    output reg         frame_valid,   // 帧有效信号
-    
-    output reg  [{h_counter_width-1}:0]  h_count,      // 水平计数器
-    output reg  [{v_counter_width-1}:0]  v_count       // 垂直计数器
-);
-
-//==============================================================================
-// 参数定义
-//==============================================================================
-
-// 水平时序参数
-localparam H_ACTIVE      = {h_active};
-localparam H_FRONT_PORCH = {h_front_porch};
-localparam H_SYNC_PULSE  = {h_sync_pulse};
-localparam H_BACK_PORCH  = {h_back_porch};
-localparam H_TOTAL       = {h_total};
-
-// 垂直时序参数
-localparam V_ACTIVE      = {v_active};
-localparam V_FRONT_PORCH = {v_front_porch};
-localparam V_SYNC_PULSE  = {v_sync_pulse};
-localparam V_BACK_PORCH  = {v_back_porch};
-localparam V_TOTAL       = {v_total};
-
-// 同步信号边界
-localparam H_SYNC_START  = H_ACTIVE + H_FRONT_PORCH;
-localparam H_SYNC_END    = H_SYNC_START + H_SYNC_PULSE;
-
-localparam V_SYNC_START  = V_ACTIVE + V_FRONT_PORCH;
-localparam V_SYNC_END    = V_SYNC_START + V_SYNC_PULSE;
-
-//==============================================================================
-// 水平计数器
-//==============================================================================
-
-always @(posedge clk or negedge rst_n) begin
-    if (!rst_n) begin
-        h_count <= {h_counter_width}'d0;
-    end else begin
-        if (h_count == H_TOTAL - 1) begin
-            h_count <= {h_counter_width}'d0;
-        end else begin
-            h_count <= h_count + 1'b1;
-        end
-    end
-end
-
-//==============================================================================
-// 垂直计数器
-//==============================================================================
-
-always @(posedge clk or negedge rst_n) begin
-    if (!rst_n) begin
-        v_count <= {v_counter_width}'d0;
-    end else begin
-        if (h_count == H_TOTAL - 1) begin
-            if (v_count == V_TOTAL - 1) begin
-                v_count <= {v_counter_width}'d0;
-            end else begin
-                v_count <= v_count + 1'b1;
-            end
-        end
-    end
-end
-
-//==============================================================================
-// 水平同步信号生成
-//==============================================================================
-
-always @(posedge clk or negedge rst_n) begin
-    if (!rst_n) begin
-        hsync <= 1'b1;
-    end else begin
-        if (h_count >= H_SYNC_START && h_count < H_SYNC_END) begin
-            hsync <= 1'b0;  // 同步脉冲为低电平
-        end else begin
-            hsync <= 1'b1;
-        end
-    end
-end
-
-//==============================================================================
-// 垂直同步信号生成
-//==============================================================================
-
-always @(posedge clk or negedge rst_n) begin
-    if (!rst_n) begin
-        vsync <= 1'b1;
-    end else begin
-        if (v_count >= V_SYNC_START && v_count < V_SYNC_END) begin
-            vsync <= 1'b0;  // 同步脉冲为低电平
-        end else begin
-            vsync <= 1'b1;
-        end
-    end
-end
-
-//==============================================================================
-// 数据使能信号生成
-//==============================================================================
-
-always @(posedge clk or negedge rst_n) begin
-    if (!rst_n) begin
-        de <= 1'b0;
-    end else begin
-        if (h_count < H_ACTIVE && v_count < V_ACTIVE) begin
-            de <= 1'b1;  // 在有效显示区域内
-        end else begin
-            de <= 1'b0;
-        end
-    end
-end
-
-//==============================================================================
-// 帧有效信号生成
-//==============================================================================
-
-always @(posedge clk or negedge rst_n) begin
-    if (!rst_n) begin
-        frame_valid <= 1'b0;
-    end else begin
-        if (v_count < V_ACTIVE) begin
-            frame_valid <= 1'b1;  // 在有效帧内
-        end else begin
-            frame_valid <= 1'b0;
-        end
-    end
-end
-
-endmodule
-"""
-    
-    return verilog_code
-
-
-def generate_testbench(timing_params: dict, module_name: str = "vesa_timing_gen") -> str:
-    """
-    生成 Verilog 测试平台代码
-    
-    参数:
-        timing_params: 时序参数字典
-        module_name: 被测模块名称
-        
-    返回:
-        生成的测试平台代码字符串
-    """
-    
-    pixel_clock = timing_params.get('pixel_clock', 148.5)
-    h_total = timing_params.get('h_total', 2200)
-    v_total = timing_params.get('v_total', 1125)
-    
-    # 计算时钟周期 (ns)
-    clk_period = 1000.0 / pixel_clock  # MHz to ns
-    
-    # 生成时间戳
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    testbench_code = f"""//==============================================================================
-// VESA Timing Generator Testbench
-// 
-// 自动生成时间: {timestamp}
-// 生成工具: VESA 视频时序计算器
-//==============================================================================
-
-`timescale 1ns / 1ps
-
-module tb_{module_name};
-
-//==============================================================================
-// 参数定义
-//==============================================================================
-
-localparam CLK_PERIOD = {clk_period:.3f};  // 时钟周期 (ns)
-localparam H_TOTAL = {h_total};
-localparam V_TOTAL = {v_total};
-
-//==============================================================================
-// 信号声明
-//==============================================================================
-
-reg         clk;
-reg         rst_n;
-
-wire        hsync;
-wire        vsync;
-wire        de;
-wire        frame_valid;
-wire [15:0] h_count;
-wire [15:0] v_count;
-
-//==============================================================================
-// 时钟生成
-//==============================================================================
-
-initial begin
-    clk = 1'b0;
-    forever #(CLK_PERIOD/2) clk = ~clk;
-end
-
-//==============================================================================
-// 复位生成
-//==============================================================================
-
-initial begin
-    rst_n = 1'b0;
-    #(CLK_PERIOD * 10);
-    rst_n = 1'b1;
-end
-
-//==============================================================================
-// 实例化被测模块
-//==============================================================================
-
-{module_name} u_{module_name} (
-    .clk         (clk),
-    .rst_n       (rst_n),
-    .hsync       (hsync),
-    .vsync       (vsync),
-    .de          (de),
-    .frame_valid (frame_valid),
-    .h_count     (h_count),
-    .v_count     (v_count)
-);
-
-//==============================================================================
-// 监控和显示
-//==============================================================================
-
-integer frame_count;
-
-initial begin
-    frame_count = 0;
-    
-    // 等待复位完成
-    @(posedge rst_n);
-    
-    // 监控帧同步信号
-    forever begin
-        @(negedge vsync);
-        frame_count = frame_count + 1;
-        $display("Time: %t ns - Frame %0d started", $time, frame_count);
-        
-        // 模拟 3 帧后停止
-        if (frame_count >= 3) begin
-            #(CLK_PERIOD * H_TOTAL * 10);
-            $display("\\nSimulation completed successfully!");
-            $display("Total frames simulated: %0d", frame_count);
-            $finish;
-        end
-    end
-end
-
-//==============================================================================
-// 波形转储 (可选)
-//==============================================================================
-
-initial begin
-    $dumpfile("tb_{module_name}.vcd");
-    $dumpvars(0, tb_{module_name});
-end
-
-//==============================================================================
-// 超时保护
-//==============================================================================
-
-initial begin
-    #(CLK_PERIOD * H_TOTAL * V_TOTAL * 5);  // 5 帧的时间
-    $display("ERROR: Simulation timeout!");
-    $finish;
-end
-
-endmodule
-"""
-    
-    return testbench_code
+"""
+VESA 时序 RTL 代码生成模板
+
+根据计算出的时序参数生成 Verilog RTL 代码。
+
+模板使用 Jinja2 在模块导入时编译一次（_RTL_TEMPLATE / _TB_TEMPLATE），
+之后每次生成只需调用已编译模板的 render()，避免重复解析模板文本。
+"""
+
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+
+from jinja2 import BaseLoader, Environment
+
+
+def _default_timestamp() -> str:
+    """
+    生成默认时间戳
+
+    优先使用 SOURCE_DATE_EPOCH 环境变量（Reproducible Builds 约定），
+    使生成结果可按字节复现；未设置时使用当前时间。
+
+    返回:
+        格式化的时间戳字符串
+    """
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch is not None:
+        return datetime.fromtimestamp(int(epoch), tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+@dataclass(slots=True)
+class _DerivedTiming:
+    """模板渲染上下文：输入时序参数加推导出的派生量"""
+
+    # 基本时序参数
+    h_active: int
+    v_active: int
+    pixel_clock: float
+    refresh_rate: float
+    h_total: int
+    h_front_porch: int
+    h_sync_pulse: int
+    h_back_porch: int
+    v_total: int
+    v_front_porch: int
+    v_sync_pulse: int
+    v_back_porch: int
+
+    # 派生参数
+    h_sync_start: int
+    h_sync_end: int
+    v_sync_start: int
+    v_sync_end: int
+    h_counter_width: int
+    v_counter_width: int
+    clk_period: float
+
+    @classmethod
+    def from_params(cls, timing_params: dict) -> '_DerivedTiming':
+        """
+        从时序参数字典推导模板渲染所需的全部字段
+
+        参数:
+            timing_params: 时序参数字典，包含所有计算结果
+
+        返回:
+            _DerivedTiming: 含同步边界和计数器位宽的渲染上下文
+        """
+        # 提取参数
+        h_active = timing_params.get('h_active', 1920)
+        v_active = timing_params.get('v_active', 1080)
+        pixel_clock = timing_params.get('pixel_clock', 148.5)
+        refresh_rate = timing_params.get('refresh_rate', 60.0)
+
+        h_total = timing_params.get('h_total', 2200)
+        h_front_porch = timing_params.get('h_front_porch', 88)
+        h_sync_pulse = timing_params.get('h_sync_pulse', 44)
+        h_back_porch = timing_params.get('h_back_porch', 148)
+
+        v_total = timing_params.get('v_total', 1125)
+        v_front_porch = timing_params.get('v_front_porch', 4)
+        v_sync_pulse = timing_params.get('v_sync_pulse', 5)
+        v_back_porch = timing_params.get('v_back_porch', 36)
+
+        # 计算同步信号的起始和结束位置
+        h_sync_start = h_active + h_front_porch
+        h_sync_end = h_sync_start + h_sync_pulse
+
+        v_sync_start = v_active + v_front_porch
+        v_sync_end = v_sync_start + v_sync_pulse
+
+        return cls(
+            h_active=h_active,
+            v_active=v_active,
+            pixel_clock=pixel_clock,
+            refresh_rate=refresh_rate,
+            h_total=h_total,
+            h_front_porch=h_front_porch,
+            h_sync_pulse=h_sync_pulse,
+            h_back_porch=h_back_porch,
+            v_total=v_total,
+            v_front_porch=v_front_porch,
+            v_sync_pulse=v_sync_pulse,
+            v_back_porch=v_back_porch,
+            h_sync_start=h_sync_start,
+            h_sync_end=h_sync_end,
+            v_sync_start=v_sync_start,
+            v_sync_end=v_sync_end,
+            # 计数器位宽
+            h_counter_width=(h_total - 1).bit_length(),
+            v_counter_width=(v_total - 1).bit_length(),
+            # 时钟周期 (ns)，MHz to ns
+            clk_period=1000.0 / pixel_clock,
+        )
+
+
+# RTL 模板源码按功能块拆分为模块级常量，便于后续按条件组合扩展；
+# 导入时拼接并编译一次
+_RTL_HEADER = """\
+//==============================================================================
+// VESA Timing Generator
+//
+// 自动生成时间: {{ timestamp }}
+// 生成工具: VESA 视频时序计算器
+//
+// 时序参数:
+//   分辨率: {{ h_active }}x{{ v_active }}
+//   刷新率: {{ '%.2f' % refresh_rate }} Hz
+//   像素时钟: {{ '%.2f' % pixel_clock }} MHz
+//
+// 水平时序:
+//   H_ACTIVE      = {{ h_active }}
+//   H_FRONT_PORCH = {{ h_front_porch }}
+//   H_SYNC_PULSE  = {{ h_sync_pulse }}
+//   H_BACK_PORCH  = {{ h_back_porch }}
+//   H_TOTAL       = {{ h_total }}
+//
+// 垂直时序:
+//   V_ACTIVE      = {{ v_active }}
+//   V_FRONT_PORCH = {{ v_front_porch }}
+//   V_SYNC_PULSE  = {{ v_sync_pulse }}
+//   V_BACK_PORCH  = {{ v_back_porch }}
+//   V_TOTAL       = {{ v_total }}
+//==============================================================================
+
+module {{ module_name }} (
+    input  wire        clk,           // 像素时钟 ({{ '%.2f' % pixel_clock }} MHz)
+    input  wire        rst_n,         // 异步复位，低电平有效
+
+    output reg         hsync,         // 水平同步信号
+    output reg         vsync,         // 垂直同步信号
+    output reg         de,            // 数据使能信号
+    output reg         frame_valid,   // 帧有效信号
+
+    output reg  [{{ h_counter_width - 1 }}:0]  h_count,      // 水平计数器
+    output reg  [{{ v_counter_width - 1 }}:0]  v_count       // 垂直计数器
+);
+
+"""
+
+_RTL_PARAMS = """\
+//==============================================================================
+// 参数定义
+//==============================================================================
+
+// 水平时序参数
+localparam H_ACTIVE      = {{ h_active }};
+localparam H_FRONT_PORCH = {{ h_front_porch }};
+localparam H_SYNC_PULSE  = {{ h_sync_pulse }};
+localparam H_BACK_PORCH  = {{ h_back_porch }};
+localparam H_TOTAL       = {{ h_total }};
+
+// 垂直时序参数
+localparam V_ACTIVE      = {{ v_active }};
+localparam V_FRONT_PORCH = {{ v_front_porch }};
+localparam V_SYNC_PULSE  = {{ v_sync_pulse }};
+localparam V_BACK_PORCH  = {{ v_back_porch }};
+localparam V_TOTAL       = {{ v_total }};
+
+// 同步信号边界
+localparam H_SYNC_START  = H_ACTIVE + H_FRONT_PORCH;
+localparam H_SYNC_END    = H_SYNC_START + H_SYNC_PULSE;
+
+localparam V_SYNC_START  = V_ACTIVE + V_FRONT_PORCH;
+localparam V_SYNC_END    = V_SYNC_START + V_SYNC_PULSE;
+
+"""
+
+_RTL_HCOUNTER = """\
+//==============================================================================
+// 水平计数器
+//==============================================================================
+
+always @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+        h_count <= {{ h_counter_width }}'d0;
+    end else begin
+        if (h_count == H_TOTAL - 1) begin
+            h_count <= {{ h_counter_width }}'d0;
+        end else begin
+            h_count <= h_count + 1'b1;
+        end
+    end
+end
+
+"""
+
+_RTL_VCOUNTER = """\
+//==============================================================================
+// 垂直计数器
+//==============================================================================
+
+always @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+        v_count <= {{ v_counter_width }}'d0;
+    end else begin
+        if (h_count == H_TOTAL - 1) begin
+            if (v_count == V_TOTAL - 1) begin
+                v_count <= {{ v_counter_width }}'d0;
+            end else begin
+                v_count <= v_count + 1'b1;
+            end
+        end
+    end
+end
+
+"""
+
+_RTL_OUTPUTS = """\
+//==============================================================================
+// 同步与输出信号生成
+//
+// 合并为单个 always 块：同一时钟沿只调度一个进程，
+// 减少仿真器事件队列压力。
+// 同步脉冲用等值比较置位/清零（每路 1 个比较器），
+// 代替 >= 与 < 的双比较器范围判断，缩短综合关键路径
+//==============================================================================
+
+always @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+        hsync       <= 1'b1;
+        vsync       <= 1'b1;
+        de          <= 1'b0;
+        frame_valid <= 1'b0;
+    end else begin
+        // 同步脉冲为低电平（与 de/frame_valid 同样保持
+        // 一拍寄存延迟，引脚波形与范围比较写法逐拍一致）
+        if (h_count == H_SYNC_START)
+            hsync <= 1'b0;
+        else if (h_count == H_SYNC_END)
+            hsync <= 1'b1;
+
+        // 垂直同步在行首翻转（v_count 已在行尾更新完毕）
+        if (h_count == 0) begin
+            if (v_count == V_SYNC_START)
+                vsync <= 1'b0;
+            else if (v_count == V_SYNC_END)
+                vsync <= 1'b1;
+        end
+
+        // 在有效显示区域内
+        de          <= (h_count < H_ACTIVE) && (v_count < V_ACTIVE);
+        // 在有效帧内
+        frame_valid <= (v_count < V_ACTIVE);
+    end
+end
+
+"""
+
+_RTL_FOOTER = """\
+endmodule
+"""
+
+_RTL_SECTIONS = (
+    _RTL_HEADER,
+    _RTL_PARAMS,
+    _RTL_HCOUNTER,
+    _RTL_VCOUNTER,
+    _RTL_OUTPUTS,
+    _RTL_FOOTER,
+)
+
+_RTL_SRC = ''.join(_RTL_SECTIONS)
+
+# 测试平台模板源码（导入时编译一次）
+_TB_SRC = """\
+//==============================================================================
+// VESA Timing Generator Testbench
+//
+// 自动生成时间: {{ timestamp }}
+// 生成工具: VESA 视频时序计算器
+//==============================================================================
+
+`timescale 1ns / 1ps
+
+module tb_{{ module_name }};
+
+//==============================================================================
+// 参数定义
+//==============================================================================
+
+localparam CLK_PERIOD = {{ '%.3f' % clk_period }};  // 时钟周期 (ns)
+localparam H_TOTAL = {{ h_total }};
+localparam V_TOTAL = {{ v_total }};
+
+//==============================================================================
+// 信号声明
+//==============================================================================
+
+reg         clk;
+reg         rst_n;
+
+wire        hsync;
+wire        vsync;
+wire        de;
+wire        frame_valid;
+wire [{{ h_counter_width - 1 }}:0] h_count;
+wire [{{ v_counter_width - 1 }}:0] v_count;
+
+//==============================================================================
+// 时钟生成
+//==============================================================================
+
+initial begin
+    clk = 1'b0;
+    forever #(CLK_PERIOD/2) clk = ~clk;
+end
+
+//==============================================================================
+// 复位生成
+//==============================================================================
+
+initial begin
+    rst_n = 1'b0;
+    #(CLK_PERIOD * 10);
+    rst_n = 1'b1;
+end
+
+//==============================================================================
+// 实例化被测模块
+//==============================================================================
+
+{{ module_name }} u_{{ module_name }} (
+    .clk         (clk),
+    .rst_n       (rst_n),
+    .hsync       (hsync),
+    .vsync       (vsync),
+    .de          (de),
+    .frame_valid (frame_valid),
+    .h_count     (h_count),
+    .v_count     (v_count)
+);
+
+//==============================================================================
+// 监控和显示
+//==============================================================================
+
+integer frame_count;
+
+initial begin
+    frame_count = 0;
+
+    // 等待复位完成
+    @(posedge rst_n);
+
+    // 监控帧同步信号
+    forever begin
+        @(negedge vsync);
+        frame_count = frame_count + 1;
+        $display("Time: %t ns - Frame %0d started", $time, frame_count);
+
+        // 模拟 3 帧后停止
+        if (frame_count >= 3) begin
+            #(CLK_PERIOD * H_TOTAL * 10);
+            $display("\\nSimulation completed successfully!");
+            $display("Total frames simulated: %0d", frame_count);
+            $finish;
+        end
+    end
+end
+
+//==============================================================================
+// 波形转储 (可选)
+//==============================================================================
+
+initial begin
+    $dumpfile("tb_{{ module_name }}.vcd");
+    $dumpvars(0, tb_{{ module_name }});
+end
+
+//==============================================================================
+// 超时保护
+//==============================================================================
+
+initial begin
+    #(CLK_PERIOD * H_TOTAL * V_TOTAL * 5);  // 5 帧的时间
+    $display("ERROR: Simulation timeout!");
+    $finish;
+end
+
+endmodule
+"""
+
+# 参数化核心模块模板：一次编译、多份参数特化。
+# 下游工具只需编译 vesa_timing_gen.v 一次，各配置通过参数覆盖实例化
+_CORE_SRC = """\
+//==============================================================================
+// VESA Timing Generator (参数化核心模块)
+//
+// 自动生成时间: {{ timestamp }}
+// 生成工具: VESA 视频时序计算器
+//
+// 所有时序参数均为模块 parameter，由各配置包装模块在例化时覆盖。
+//==============================================================================
+
+module vesa_timing_gen #(
+    parameter H_ACTIVE      = 1920,
+    parameter H_FRONT_PORCH = 88,
+    parameter H_SYNC_PULSE  = 44,
+    parameter H_BACK_PORCH  = 148,
+    parameter H_TOTAL       = 2200,
+
+    parameter V_ACTIVE      = 1080,
+    parameter V_FRONT_PORCH = 4,
+    parameter V_SYNC_PULSE  = 5,
+    parameter V_BACK_PORCH  = 36,
+    parameter V_TOTAL       = 1125,
+
+    parameter H_CW          = 12,   // 水平计数器位宽
+    parameter V_CW          = 11    // 垂直计数器位宽
+) (
+    input  wire             clk,           // 像素时钟
+    input  wire             rst_n,         // 异步复位，低电平有效
+
+    output reg              hsync,         // 水平同步信号
+    output reg              vsync,         // 垂直同步信号
+    output reg              de,            // 数据使能信号
+    output reg              frame_valid,   // 帧有效信号
+
+    output reg  [H_CW-1:0]  h_count,       // 水平计数器
+    output reg  [V_CW-1:0]  v_count        // 垂直计数器
+);
+
+//==============================================================================
+// 同步信号边界
+//==============================================================================
+
+localparam H_SYNC_START  = H_ACTIVE + H_FRONT_PORCH;
+localparam H_SYNC_END    = H_SYNC_START + H_SYNC_PULSE;
+
+localparam V_SYNC_START  = V_ACTIVE + V_FRONT_PORCH;
+localparam V_SYNC_END    = V_SYNC_START + V_SYNC_PULSE;
+
+//==============================================================================
+// 水平计数器
+//==============================================================================
+
+always @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+        h_count <= {H_CW{1'b0}};
+    end else begin
+        if (h_count == H_TOTAL - 1) begin
+            h_count <= {H_CW{1'b0}};
+        end else begin
+            h_count <= h_count + 1'b1;
+        end
+    end
+end
+
+//==============================================================================
+// 垂直计数器
+//==============================================================================
+
+always @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+        v_count <= {V_CW{1'b0}};
+    end else begin
+        if (h_count == H_TOTAL - 1) begin
+            if (v_count == V_TOTAL - 1) begin
+                v_count <= {V_CW{1'b0}};
+            end else begin
+                v_count <= v_count + 1'b1;
+            end
+        end
+    end
+end
+
+//==============================================================================
+// 同步与输出信号生成
+//==============================================================================
+
+always @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+        hsync       <= 1'b1;
+        vsync       <= 1'b1;
+        de          <= 1'b0;
+        frame_valid <= 1'b0;
+    end else begin
+        // 同步脉冲为低电平（与 de/frame_valid 同样保持
+        // 一拍寄存延迟，引脚波形与范围比较写法逐拍一致）
+        if (h_count == H_SYNC_START)
+            hsync <= 1'b0;
+        else if (h_count == H_SYNC_END)
+            hsync <= 1'b1;
+
+        // 垂直同步在行首翻转（v_count 已在行尾更新完毕）
+        if (h_count == 0) begin
+            if (v_count == V_SYNC_START)
+                vsync <= 1'b0;
+            else if (v_count == V_SYNC_END)
+                vsync <= 1'b1;
+        end
+
+        // 在有效显示区域内
+        de          <= (h_count < H_ACTIVE) && (v_count < V_ACTIVE);
+        // 在有效帧内
+        frame_valid <= (v_count < V_ACTIVE);
+    end
+end
+
+endmodule
+"""
+
+# 按配置特化的薄包装模块模板：只覆盖核心模块的参数
+_WRAPPER_SRC = """\
+//==============================================================================
+// {{ module_name }}
+//
+// 自动生成时间: {{ timestamp }}
+// 生成工具: VESA 视频时序计算器
+//
+// 时序参数:
+//   分辨率: {{ h_active }}x{{ v_active }}
+//   刷新率: {{ '%.2f' % refresh_rate }} Hz
+//   像素时钟: {{ '%.2f' % pixel_clock }} MHz
+//
+// 参数化核心模块 vesa_timing_gen 的配置特化包装，
+// 需与 vesa_timing_gen.v 一起编译。
+//==============================================================================
+
+module {{ module_name }} (
+    input  wire        clk,           // 像素时钟 ({{ '%.2f' % pixel_clock }} MHz)
+    input  wire        rst_n,         // 异步复位，低电平有效
+
+    output wire        hsync,         // 水平同步信号
+    output wire        vsync,         // 垂直同步信号
+    output wire        de,            // 数据使能信号
+    output wire        frame_valid,   // 帧有效信号
+
+    output wire [{{ h_counter_width - 1 }}:0]  h_count,      // 水平计数器
+    output wire [{{ v_counter_width - 1 }}:0]  v_count       // 垂直计数器
+);
+
+vesa_timing_gen #(
+    .H_ACTIVE      ({{ h_active }}),
+    .H_FRONT_PORCH ({{ h_front_porch }}),
+    .H_SYNC_PULSE  ({{ h_sync_pulse }}),
+    .H_BACK_PORCH  ({{ h_back_porch }}),
+    .H_TOTAL       ({{ h_total }}),
+    .V_ACTIVE      ({{ v_active }}),
+    .V_FRONT_PORCH ({{ v_front_porch }}),
+    .V_SYNC_PULSE  ({{ v_sync_pulse }}),
+    .V_BACK_PORCH  ({{ v_back_porch }}),
+    .V_TOTAL       ({{ v_total }}),
+    .H_CW          ({{ h_counter_width }}),
+    .V_CW          ({{ v_counter_width }})
+) u_core (
+    .clk         (clk),
+    .rst_n       (rst_n),
+    .hsync       (hsync),
+    .vsync       (vsync),
+    .de          (de),
+    .frame_valid (frame_valid),
+    .h_count     (h_count),
+    .v_count     (v_count)
+);
+
+endmodule
+"""
+
+# Jinja2 环境和已编译模板（模块级常量，导入时编译一次，之后复用字节码）
+_ENV = Environment(loader=BaseLoader(), trim_blocks=True, lstrip_blocks=True)
+_RTL_TEMPLATE = _ENV.from_string(_RTL_SRC)
+_TB_TEMPLATE = _ENV.from_string(_TB_SRC)
+_CORE_TEMPLATE = _ENV.from_string(_CORE_SRC)
+_WRAPPER_TEMPLATE = _ENV.from_string(_WRAPPER_SRC)
+
+
+def generate_verilog_rtl(timing_params: dict, module_name: str = "vesa_timing_gen",
+                         timestamp: str = None) -> str:
+    """
+    生成 Verilog RTL 代码
+
+    参数:
+        timing_params: 时序参数字典，包含所有计算结果
+        module_name: 模块名称
+        timestamp: 写入文件头的时间戳；None 时自动生成
+                   （支持 SOURCE_DATE_EPOCH 以获得可复现输出）
+
+    返回:
+        生成的 Verilog 代码字符串
+    """
+    if timestamp is None:
+        timestamp = _default_timestamp()
+
+    derived = _DerivedTiming.from_params(timing_params)
+    return _RTL_TEMPLATE.render(
+        **asdict(derived),
+        module_name=module_name,
+        timestamp=timestamp,
+    )
+
+
+def generate_testbench(timing_params: dict, module_name: str = "vesa_timing_gen",
+                       timestamp: str = None) -> str:
+    """
+    生成 Verilog 测试平台代码
+
+    参数:
+        timing_params: 时序参数字典
+        module_name: 被测模块名称
+        timestamp: 写入文件头的时间戳；None 时自动生成
+                   （支持 SOURCE_DATE_EPOCH 以获得可复现输出）
+
+    返回:
+        生成的测试平台代码字符串
+    """
+    if timestamp is None:
+        timestamp = _default_timestamp()
+
+    derived = _DerivedTiming.from_params(timing_params)
+    return _TB_TEMPLATE.render(
+        **asdict(derived),
+        module_name=module_name,
+        timestamp=timestamp,
+    )
+
+
+def generate_verilog_rtl_to(timing_params: dict, fp,
+                            module_name: str = "vesa_timing_gen",
+                            timestamp: str = None) -> None:
+    """
+    流式生成 Verilog RTL 代码并写入文件对象
+
+    使用模板的 generate() 按片段产出并逐段 write，
+    不在内存中拼接完整源码字符串，适合把输出直接送往磁盘。
+
+    参数:
+        timing_params: 时序参数字典，包含所有计算结果
+        fp: 任何带 write(str) 方法的文件对象
+        module_name: 模块名称
+        timestamp: 写入文件头的时间戳；None 时自动生成
+    """
+    if timestamp is None:
+        timestamp = _default_timestamp()
+
+    derived = _DerivedTiming.from_params(timing_params)
+    for chunk in _RTL_TEMPLATE.generate(
+            **asdict(derived), module_name=module_name, timestamp=timestamp):
+        fp.write(chunk)
+
+
+def generate_testbench_to(timing_params: dict, fp,
+                          module_name: str = "vesa_timing_gen",
+                          timestamp: str = None) -> None:
+    """
+    流式生成测试平台代码并写入文件对象
+
+    参数:
+        timing_params: 时序参数字典
+        fp: 任何带 write(str) 方法的文件对象
+        module_name: 被测模块名称
+        timestamp: 写入文件头的时间戳；None 时自动生成
+    """
+    if timestamp is None:
+        timestamp = _default_timestamp()
+
+    derived = _DerivedTiming.from_params(timing_params)
+    for chunk in _TB_TEMPLATE.generate(
+            **asdict(derived), module_name=module_name, timestamp=timestamp):
+        fp.write(chunk)
+
+
+def generate_rtl_and_testbench(timing_params: dict, module_name: str = "vesa_timing_gen",
+                               timestamp: str = None) -> tuple:
+    """
+    一次性生成 RTL 代码和测试平台代码
+
+    参数字典只解析一次（_DerivedTiming 共享给两个模板），
+    时间戳也只生成一次，两个文件头保持一致。
+
+    参数:
+        timing_params: 时序参数字典，包含所有计算结果
+        module_name: 模块名称
+        timestamp: 写入文件头的时间戳；None 时自动生成
+
+    返回:
+        (rtl_code, tb_code): RTL 代码和测试平台代码字符串
+    """
+    if timestamp is None:
+        timestamp = _default_timestamp()
+
+    context = asdict(_DerivedTiming.from_params(timing_params))
+    rtl_code = _RTL_TEMPLATE.render(**context, module_name=module_name, timestamp=timestamp)
+    tb_code = _TB_TEMPLATE.render(**context, module_name=module_name, timestamp=timestamp)
+    return rtl_code, tb_code
+
+
+def generate_core_module(timestamp: str = None) -> str:
+    """
+    生成参数化核心模块 vesa_timing_gen.v
+
+    整批配置只需生成并编译一份核心模块，各配置通过
+    generate_config_wrapper 产生的薄包装以参数覆盖方式例化它。
+
+    参数:
+        timestamp: 写入文件头的时间戳；None 时自动生成
+
+    返回:
+        参数化核心模块的 Verilog 代码字符串
+    """
+    if timestamp is None:
+        timestamp = _default_timestamp()
+
+    return _CORE_TEMPLATE.render(timestamp=timestamp)
+
+
+def generate_config_wrapper(timing_params: dict, module_name: str = "vesa_timing_gen",
+                            timestamp: str = None) -> str:
+    """
+    生成配置特化的薄包装模块
+
+    包装模块与独立生成的 RTL 模块端口完全一致，
+    内部仅以参数覆盖方式例化 vesa_timing_gen 核心模块。
+
+    参数:
+        timing_params: 时序参数字典，包含所有计算结果
+        module_name: 包装模块名称
+        timestamp: 写入文件头的时间戳；None 时自动生成
+
+    返回:
+        包装模块的 Verilog 代码字符串
+    """
+    if timestamp is None:
+        timestamp = _default_timestamp()
+
+    derived = _DerivedTiming.from_params(timing_params)
+    return _WRAPPER_TEMPLATE.render(
+        **asdict(derived),
+        module_name=module_name,
+        timestamp=timestamp,
+    )
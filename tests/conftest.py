@@ -0,0 +1,56 @@
+"""
+pytest 共享夹具
+
+QApplication 初始化整个 Qt 平台插件栈，每个测试各建一个实例
+既慢（Linux 上约 100ms）又不被 Qt 支持（同进程只能有一个）。
+这里提供会话级共享实例，所有 GUI 测试复用。
+"""
+import os
+import sys
+
+import pytest
+
+# 添加 src 目录到 Python 路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PyQt5.QtWidgets import QApplication
+
+from vesa_timing_core import VesaCalculator
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_calculator():
+    """
+    会话开始时预热计算核心
+    
+    双参数模式的数值核心经 Numba JIT 编译，首次调用要付一次
+    编译成本（cache=True 时为磁盘缓存加载）。在任何测试计时前
+    触发一次典型计算，让编译/缓存开销不计入单个测试。
+    """
+    VesaCalculator().calculate(h_active=1920, v_active=1080,
+                               refresh_rate=60.0, pixel_clock=148.5)
+
+
+@pytest.fixture(scope="session")
+def calculator():
+    """
+    会话级共享的 VesaCalculator 实例
+    
+    计算器无状态，结果层面的去重由核心模块的 lru_cache 承担：
+    不同测试文件重复请求相同配置（如 1920x1080@60Hz/148.5MHz）时
+    直接命中缓存，不再重复整个 CVT 计算。
+    """
+    return VesaCalculator()
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """会话级共享的 QApplication 实例"""
+    app = QApplication.instance() or QApplication(sys.argv)
+    yield app
+
+
+@pytest.fixture(scope="session")
+def app(qapp):
+    """qapp 的别名，兼容按 app 参数名取夹具的测试"""
+    return qapp
@@ -1,104 +1,100 @@
-"""
-测试反向计算功能：从像素时钟计算刷新率
-"""
-
-import sys
-import os
-
-# 添加 src 目录到 Python 路径
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from vesa_timing_calculator import VesaCalculator
-
-def test_reverse_calculation():
-    """测试从像素时钟反向计算"""
-    calculator = VesaCalculator()
-    
-    print("=" * 60)
-    print("测试反向计算：从像素时钟计算刷新率")
-    print("=" * 60)
-    
-    # 测试 1: 1920x1080, 148.5 MHz (标准 HDMI 1080p60)
-    print("\n测试 1: 1920x1080 @ 148.5 MHz")
-    results = calculator.calculate(
-        h_active=1920,
-        v_active=1080,
-        pixel_clock=148.5,
-        reduced_blanking=False
-    )
-    
-    if 'error' in results:
-        print(f"错误: {results['message']}")
-    else:
-        print(f"计算出的刷新率: {results['refresh_rate']:.2f} Hz")
-        print(f"像素时钟: {results['pixel_clock']:.2f} MHz")
-        print(f"水平总像素: {results['h_total']}")
-        print(f"垂直总行数: {results['v_total']}")
-    
-    # 测试 2: 1920x1080, 138.5 MHz (CVT-RB)
-    print("\n测试 2: 1920x1080 @ 138.5 MHz (Reduced Blanking)")
-    results = calculator.calculate(
-        h_active=1920,
-        v_active=1080,
-        pixel_clock=138.5,
-        reduced_blanking=True
-    )
-    
-    if 'error' in results:
-        print(f"错误: {results['message']}")
-    else:
-        print(f"计算出的刷新率: {results['refresh_rate']:.2f} Hz")
-        print(f"像素时钟: {results['pixel_clock']:.2f} MHz")
-        print(f"水平总像素: {results['h_total']}")
-        print(f"垂直总行数: {results['v_total']}")
-    
-    # 测试 3: 3840x2160, 297 MHz (4K60)
-    print("\n测试 3: 3840x2160 @ 297 MHz")
-    results = calculator.calculate(
-        h_active=3840,
-        v_active=2160,
-        pixel_clock=297.0,
-        reduced_blanking=False
-    )
-    
-    if 'error' in results:
-        print(f"错误: {results['message']}")
-    else:
-        print(f"计算出的刷新率: {results['refresh_rate']:.2f} Hz")
-        print(f"像素时钟: {results['pixel_clock']:.2f} MHz")
-        print(f"水平总像素: {results['h_total']}")
-        print(f"垂直总行数: {results['v_total']}")
-    
-    print("\n" + "=" * 60)
-    print("测试完成")
-    print("=" * 60)
-
-def test_forward_calculation():
-    """测试正向计算（验证原有功能仍然正常）"""
-    calculator = VesaCalculator()
-    
-    print("\n" + "=" * 60)
-    print("测试正向计算：从刷新率计算像素时钟")
-    print("=" * 60)
-    
-    # 测试: 1920x1080 @ 60Hz
-    print("\n测试: 1920x1080 @ 60Hz")
-    results = calculator.calculate(
-        h_active=1920,
-        v_active=1080,
-        refresh_rate=60.0,
-        reduced_blanking=False
-    )
-    
-    if 'error' in results:
-        print(f"错误: {results['message']}")
-    else:
-        print(f"像素时钟: {results['pixel_clock']:.2f} MHz")
-        print(f"水平总像素: {results['h_total']}")
-        print(f"垂直总行数: {results['v_total']}")
-    
-    print("\n" + "=" * 60)
-
-if __name__ == "__main__":
-    test_reverse_calculation()
-    test_forward_calculation()
+"""
+测试反向计算功能：从像素时钟计算刷新率
+
+三个反向计算用例经 @pytest.mark.parametrize 展开为独立测试项，
+可被 pytest-xdist（pytest -n auto）分发到多核并行执行。
+
+报告文本先写入 StringIO 缓冲，函数末尾一次 sys.stdout.write
+输出，数十次 print 的 stdout 加锁/刷新收敛为一次系统调用。
+"""
+
+import io
+import sys
+import os
+
+import pytest
+
+# 添加 src 目录到 Python 路径（pytest 下由 conftest 统一插入，这里
+# 仅为直接以脚本方式运行保留，且有防重复守卫）
+_SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+from vesa_timing_calculator import VesaCalculator
+
+
+# 反向计算用例：(描述, h_active, v_active, pixel_clock, reduced_blanking)
+REVERSE_CASES = (
+    ("1920x1080 @ 148.5 MHz", 1920, 1080, 148.5, False),
+    ("1920x1080 @ 138.5 MHz (Reduced Blanking)", 1920, 1080, 138.5, True),
+    ("3840x2160 @ 297 MHz", 3840, 2160, 297.0, False),
+)
+
+
+@pytest.mark.parametrize("description,h_active,v_active,pixel_clock,reduced_blanking",
+                         REVERSE_CASES,
+                         ids=[case[0] for case in REVERSE_CASES])
+def test_reverse_calculation(calculator, description, h_active, v_active,
+                             pixel_clock, reduced_blanking):
+    """测试从像素时钟反向计算刷新率"""
+    buf = io.StringIO()
+
+    print(f"测试: {description}", file=buf)
+    results = calculator.calculate(
+        h_active=h_active,
+        v_active=v_active,
+        pixel_clock=pixel_clock,
+        reduced_blanking=reduced_blanking
+    )
+
+    assert 'error' not in results, results.get('message')
+    print(f"计算出的刷新率: {results['refresh_rate']:.2f} Hz", file=buf)
+    print(f"像素时钟: {results['pixel_clock']:.2f} MHz", file=buf)
+    print(f"水平总像素: {results['h_total']}", file=buf)
+    print(f"垂直总行数: {results['v_total']}", file=buf)
+
+    # 刷新率应与 像素时钟 / (h_total * v_total) 自洽（结果保留两位小数）
+    implied_rate = pixel_clock * 1e6 / (results['h_total'] * results['v_total'])
+    assert results['refresh_rate'] == pytest.approx(implied_rate, abs=0.005)
+    assert results['pixel_clock'] == pytest.approx(pixel_clock)
+
+    sys.stdout.write(buf.getvalue())
+
+
+def test_forward_calculation(calculator):
+    """测试正向计算（验证原有功能仍然正常）"""
+    buf = io.StringIO()
+
+    print("\n" + "=" * 60, file=buf)
+    print("测试正向计算：从刷新率计算像素时钟", file=buf)
+    print("=" * 60, file=buf)
+
+    # 测试: 1920x1080 @ 60Hz
+    print("\n测试: 1920x1080 @ 60Hz", file=buf)
+    results = calculator.calculate(
+        h_active=1920,
+        v_active=1080,
+        refresh_rate=60.0,
+        reduced_blanking=False
+    )
+
+    assert 'error' not in results, results.get('message')
+    print(f"像素时钟: {results['pixel_clock']:.2f} MHz", file=buf)
+    print(f"水平总像素: {results['h_total']}", file=buf)
+    print(f"垂直总行数: {results['v_total']}", file=buf)
+
+    # 1920x1080@60Hz 标准 CVT 的已知参考值
+    assert results['pixel_clock'] == pytest.approx(147.84)
+    assert results['h_total'] == 2200
+    assert results['v_total'] == 1120
+
+    print("\n" + "=" * 60, file=buf)
+
+    sys.stdout.write(buf.getvalue())
+
+
+if __name__ == "__main__":
+    _calculator = VesaCalculator()
+    for _case in REVERSE_CASES:
+        test_reverse_calculation(_calculator, *_case)
+    test_forward_calculation(_calculator)
@@ -1,96 +1,118 @@
-"""
-测试 RTL 代码生成功能
-"""
-
-import os
-import sys
-
-# 添加 src 目录到 Python 路径
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from vesa_timing_calculator import VesaCalculator
-from vesa_timing_rtl_template import generate_verilog_rtl, generate_testbench
-
-
-def test_rtl_generation():
-    """测试 RTL 代码生成"""
-    
-    print("=" * 60)
-    print("测试 RTL 代码生成功能")
-    print("=" * 60)
-    
-    # 创建计算器实例
-    calculator = VesaCalculator()
-    
-    # 计算 1920x1080@60Hz 的时序参数
-    print("\n计算 1920x1080@60Hz 时序参数...")
-    results = calculator.calculate(
-        h_active=1920,
-        v_active=1080,
-        refresh_rate=60.0,
-        reduced_blanking=False
-    )
-    
-    if 'error' in results:
-        print(f"错误: {results['message']}")
-        return
-    
-    # 添加基本参数到结果中
-    results['h_active'] = 1920
-    results['v_active'] = 1080
-    results['refresh_rate'] = 60.0
-    
-    print("时序参数计算完成:")
-    print(f"  像素时钟: {results['pixel_clock']:.2f} MHz")
-    print(f"  水平总像素: {results['h_total']}")
-    print(f"  垂直总行数: {results['v_total']}")
-    
-    # 创建输出目录
-    output_dir = "./output"
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        print(f"\n创建输出目录: {output_dir}")
-    
-    # 生成 RTL 代码
-    print("\n生成 RTL 代码...")
-    module_name = "vesa_timing_1920x1080_60hz"
-    
-    rtl_code = generate_verilog_rtl(results, module_name)
-    rtl_filename = os.path.join(output_dir, f"{module_name}.v")
-    
-    with open(rtl_filename, 'w', encoding='utf-8') as f:
-        f.write(rtl_code)
-    
-    print(f"RTL 代码已保存: {rtl_filename}")
-    
-    # 生成测试平台
-    print("生成测试平台...")
-    tb_code = generate_testbench(results, module_name)
-    tb_filename = os.path.join(output_dir, f"tb_{module_name}.v")
-    
-    with open(tb_filename, 'w', encoding='utf-8') as f:
-        f.write(tb_code)
-    
-    print(f"测试平台已保存: {tb_filename}")
-    
-    # 显示生成的文件信息
-    print("\n生成的文件:")
-    print(f"  1. {rtl_filename} ({os.path.getsize(rtl_filename)} bytes)")
-    print(f"  2. {tb_filename} ({os.path.getsize(tb_filename)} bytes)")
-    
-    # 显示 RTL 代码的前几行
-    print("\nRTL 代码预览 (前 30 行):")
-    print("-" * 60)
-    with open(rtl_filename, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-        for i, line in enumerate(lines[:30], 1):
-            print(f"{i:3d}: {line}", end='')
-    print("-" * 60)
-    
-    print("\n" + "=" * 60)
-    print("测试完成！")
-    print("=" * 60)
-
-
-if __name__ == "__main__":
-    test_rtl_generation()
+"""
+测试 RTL 代码生成功能
+"""
+
+import os
+import sys
+
+# 添加 src 目录到 Python 路径（pytest 下由 conftest 统一插入，这里
+# 仅为直接以脚本方式运行保留，且有防重复守卫）
+_SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+from vesa_timing_calculator import VesaCalculator
+from vesa_timing_rtl_template import generate_verilog_rtl_to, generate_testbench_to
+
+
+class _TeeHead:
+    """写入适配器：转发所有 write，累计写入字节数，并留存前 n 行用于预览"""
+
+    def __init__(self, fp, n=30):
+        self._fp = fp
+        self._n = n
+        self._tail = ""
+        self.head_lines = []
+        self.bytes_written = 0
+
+    def write(self, chunk):
+        self._fp.write(chunk)
+        self.bytes_written += len(chunk.encode('utf-8'))
+        if len(self.head_lines) < self._n:
+            self._tail += chunk
+            *complete, self._tail = self._tail.split("\n")
+            for line in complete:
+                if len(self.head_lines) < self._n:
+                    self.head_lines.append(line)
+
+
+def test_rtl_generation(calculator, tmp_path):
+    """测试 RTL 代码生成（写入临时目录，不触碰仓库内的 output/ 产物）"""
+    
+    print("=" * 60)
+    print("测试 RTL 代码生成功能")
+    print("=" * 60)
+    
+    # 计算 1920x1080@60Hz 的时序参数
+    print("\n计算 1920x1080@60Hz 时序参数...")
+    results = calculator.calculate(
+        h_active=1920,
+        v_active=1080,
+        refresh_rate=60.0,
+        reduced_blanking=False
+    )
+    
+    if 'error' in results:
+        print(f"错误: {results['message']}")
+        return
+    
+    # 添加基本参数到结果中
+    results['h_active'] = 1920
+    results['v_active'] = 1080
+    results['refresh_rate'] = 60.0
+    
+    print("时序参数计算完成:")
+    print(f"  像素时钟: {results['pixel_clock']:.2f} MHz")
+    print(f"  水平总像素: {results['h_total']}")
+    print(f"  垂直总行数: {results['v_total']}")
+    
+    # 输出写入 pytest 提供的临时目录；仓库里的 output/ 由
+    # examples/demo_rtl_generation.py 统一生成（包装模块格式），
+    # 测试不得用独立模块格式覆盖这些已提交产物
+    output_dir = os.fspath(tmp_path)
+
+    # 生成 RTL 代码（流式写盘，同时留存前 30 行做预览，
+    # 不在内存里拼完整字符串、也不回读文件）
+    print("\n生成 RTL 代码...")
+    module_name = "vesa_timing_1920x1080_60hz"
+    
+    rtl_filename = os.path.join(output_dir, f"{module_name}.v")
+    with open(rtl_filename, 'w', encoding='utf-8', buffering=65536) as f:
+        tee = _TeeHead(f, n=30)
+        generate_verilog_rtl_to(results, tee, module_name)
+    
+    print(f"RTL 代码已保存: {rtl_filename}")
+    
+    # 生成测试平台
+    print("生成测试平台...")
+    tb_filename = os.path.join(output_dir, f"tb_{module_name}.v")
+    
+    with open(tb_filename, 'w', encoding='utf-8', buffering=65536) as f:
+        tb_tee = _TeeHead(f, n=0)
+        generate_testbench_to(results, tb_tee, module_name)
+
+    print(f"测试平台已保存: {tb_filename}")
+
+    # 显示生成的文件信息（字节数在写入时累计，免去两次 stat 系统调用）
+    print("\n生成的文件:")
+    print(f"  1. {rtl_filename} ({tee.bytes_written} bytes)")
+    print(f"  2. {tb_filename} ({tb_tee.bytes_written} bytes)")
+    
+    # 显示 RTL 代码的前几行（生成时已留存，无需回读文件）
+    print("\nRTL 代码预览 (前 30 行):")
+    print("-" * 60)
+    for i, line in enumerate(tee.head_lines, 1):
+        print(f"{i:3d}: {line}")
+    print("-" * 60)
+    
+    print("\n" + "=" * 60)
+    print("测试完成！")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    with tempfile.TemporaryDirectory() as _tmp_dir:
+        test_rtl_generation(VesaCalculator(), Path(_tmp_dir))